@@ -113,6 +113,16 @@ class TestRequirementExtraction:
         assert "REQ-01" in result
         assert "ユーザーログイン" in result
 
+    def test_find_requirement_detail_skips_mentions(self):
+        """Test that lines mentioning the ID without requirement text are skipped."""
+        requirements_content = """REQ-01 overview
+## 機能要件
+- **REQ-01**: システムは、ユーザーログインすること"""
+
+        result = _find_requirement_detail(requirements_content, "REQ-01")
+
+        assert result == "- **REQ-01**: システムは、ユーザーログインすること"
+
     def test_find_requirement_detail_not_found(self):
         """Test finding requirement detail when not found."""
         requirements_content = """
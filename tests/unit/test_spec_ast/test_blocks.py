@@ -5,10 +5,12 @@ from wassden.lib.spec_ast.blocks import (
     BlockType,
     DocumentBlock,
     ListItemBlock,
+    ReferenceFlags,
     RequirementBlock,
     SectionBlock,
     TaskBlock,
 )
+from wassden.lib.spec_ast.section_patterns import SectionType
 
 
 class TestDocumentBlock:
@@ -45,6 +47,111 @@ class TestDocumentBlock:
         assert "en" in result
         assert "0 sections" in result
 
+    def test_top_section_titles_cached_until_child_added(self) -> None:
+        """Test that level 2 section titles are cached and refreshed by add_child."""
+        doc = DocumentBlock(line_start=1, line_end=10, raw_content="")
+        doc.add_child(SectionBlock(line_start=1, line_end=1, raw_content="## Overview", level=2, title="Overview"))
+        doc.add_child(SectionBlock(line_start=2, line_end=2, raw_content="### Detail", level=3, title="Detail"))
+
+        titles = doc.top_section_titles
+        assert titles == ["Overview"]
+        assert doc.top_section_titles is titles
+
+        doc.add_child(SectionBlock(line_start=3, line_end=3, raw_content="## Scope", level=2, title="Scope"))
+        assert doc.top_section_titles == ["Overview", "Scope"]
+
+    def test_section_types_cached_until_child_added(self) -> None:
+        """Test that section types are indexed together with titles and refreshed by add_child."""
+        doc = DocumentBlock(line_start=1, line_end=10, raw_content="")
+        doc.add_child(
+            SectionBlock(
+                line_start=1,
+                line_end=1,
+                raw_content="## Overview",
+                level=2,
+                title="Overview",
+                section_type=SectionType.OVERVIEW,
+            )
+        )
+
+        types = doc.section_types
+        assert types == {SectionType.OVERVIEW}
+        assert doc.section_types is types
+
+        doc.add_child(
+            SectionBlock(
+                line_start=2,
+                line_end=2,
+                raw_content="### Scope",
+                level=3,
+                title="Scope",
+                section_type=SectionType.SCOPE,
+            )
+        )
+        assert doc.section_types == {SectionType.OVERVIEW, SectionType.SCOPE}
+        assert doc.top_section_titles == ["Overview"]
+
+    def test_blocks_by_type_indexed_until_child_added(self) -> None:
+        """Test that type lookups share one index, return copies, and refresh on add_child."""
+        doc = DocumentBlock(line_start=1, line_end=10, raw_content="")
+        section = SectionBlock(line_start=1, line_end=1, raw_content="## Tasks", level=2, title="Tasks")
+        section.add_child(TaskBlock(line_start=2, line_end=2, raw_content="- TASK-01-01: Do", task_id="TASK-01-01"))
+        doc.add_child(section)
+
+        tasks = doc.get_blocks_by_type(BlockType.TASK)
+        assert [block.task_id for block in tasks if isinstance(block, TaskBlock)] == ["TASK-01-01"]
+        tasks.clear()
+        assert len(doc.get_blocks_by_type(BlockType.TASK)) == 1
+        assert doc.get_blocks_by_type(BlockType.REQUIREMENT) == []
+
+        doc.add_child(TaskBlock(line_start=3, line_end=3, raw_content="- TASK-01-02: Do", task_id="TASK-01-02"))
+        assert len(doc.get_blocks_by_type(BlockType.TASK)) == 2
+
+    def test_cached_views_reset_by_nested_add_child(self) -> None:
+        """Test that blocks added below a section are seen by previously cached document views."""
+        doc = DocumentBlock(line_start=1, line_end=10, raw_content="")
+        section = SectionBlock(line_start=1, line_end=1, raw_content="## Tasks", level=2, title="Tasks")
+        doc.add_child(section)
+        assert doc.get_blocks_by_type(BlockType.TASK) == []
+        assert doc.reference_flags == ReferenceFlags()
+
+        subsection = SectionBlock(line_start=2, line_end=2, raw_content="## Scope", level=2, title="Scope")
+        section.add_child(subsection)
+        subsection.add_child(
+            TaskBlock(line_start=3, line_end=3, raw_content="", task_id="TASK-01-01", req_refs=["REQ-01"])
+        )
+
+        assert [block.line_start for block in doc.get_blocks_by_type(BlockType.TASK)] == [3]
+        assert doc.reference_flags == ReferenceFlags(has_task_req_refs=True)
+        assert doc.top_section_titles == ["Tasks", "Scope"]
+
+    def test_cached_views_reset_only_by_add_child(self) -> None:
+        """Test the add_child() contract: direct edits are not seen by views already cached."""
+        doc = DocumentBlock(line_start=1, line_end=10, raw_content="")
+        # Appending before the first view is computed is fine: nothing is cached yet
+        doc.children.append(SectionBlock(line_start=1, line_end=1, raw_content="## Scope", title="Scope"))
+        assert doc.top_section_titles == ["Scope"]
+
+        doc.children.append(SectionBlock(line_start=2, line_end=2, raw_content="## Tasks", title="Tasks"))
+        assert doc.top_section_titles == ["Scope"]
+
+        doc.add_child(SectionBlock(line_start=3, line_end=3, raw_content="## Notes", title="Notes"))
+        assert doc.top_section_titles == ["Scope", "Tasks", "Notes"]
+
+    def test_reference_flags_computed_from_tree(self) -> None:
+        """Test that reference flags are derived from descendants and reset by add_child."""
+        doc = DocumentBlock(line_start=1, line_end=10, raw_content="")
+        section = SectionBlock(line_start=1, line_end=1, raw_content="## Tasks", title="Tasks")
+        section.add_child(
+            TaskBlock(line_start=2, line_end=2, raw_content="", task_id="TASK-01-01", req_refs=["REQ-01"])
+        )
+        doc.add_child(section)
+
+        assert doc.reference_flags == ReferenceFlags(has_task_req_refs=True)
+
+        doc.add_child(RequirementBlock(line_start=3, line_end=3, raw_content="", req_id="REQ-01"))
+        assert doc.reference_flags == ReferenceFlags(has_req_ids=True, has_task_req_refs=True)
+
 
 class TestSectionBlock:
     """Tests for SectionBlock."""
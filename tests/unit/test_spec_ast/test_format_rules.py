@@ -107,7 +107,7 @@ class TestTaskIDFormatRule:
         document = DocumentBlock(line_start=1, line_end=100, raw_content="# Tasks")
 
         # Add task blocks with invalid IDs
-        invalid_ids = ["TASK-00-01", "TASK-01-00", "TASK-ABC-01", "TASK-01"]
+        invalid_ids = ["TASK-00-01", "TASK-01-00", "TASK-ABC-01", "TASK-01", "TASK-01-01-00"]
         for task_id in invalid_ids:
             task_block = TaskBlock(
                 line_start=10,
@@ -123,7 +123,7 @@ class TestTaskIDFormatRule:
         result = rule.validate(document, context)
 
         assert not result.is_valid
-        assert len(result.errors) == 4
+        assert len(result.errors) == 5
 
 
 class TestDuplicateRequirementIDRule:
@@ -139,12 +139,24 @@ class TestExtractTaskDependencies:
         assert "TASK-01-01" in deps
         assert "TASK-02-03" in deps
 
+    def test_extract_dependencies_grouped_by_phrase(self) -> None:
+        """Test that dependencies are listed by phrase kind, then by position."""
+        text = "Run after TASK-01-03; depends on TASK-01-02 and depends on TASK-01-01"
+        deps = IDExtractor.extract_task_dependencies(text)
+        assert deps == ["TASK-01-02", "TASK-01-01", "TASK-01-03"]
+
     def test_extract_no_dependencies(self) -> None:
         """Test when no dependencies present."""
         text = "Task with no dependencies"
         deps = IDExtractor.extract_task_dependencies(text)
         assert len(deps) == 0
 
+    def test_count_task_dependencies(self) -> None:
+        """Test that counting agrees with extraction."""
+        text = "Depends on TASK-01-01, requires TASK-02-03 and runs after TASK-01-01. 依存: TASK-03-01"
+        assert IDExtractor.count_task_dependencies(text) == len(IDExtractor.extract_task_dependencies(text)) == 4
+        assert IDExtractor.count_task_dependencies("Task with no dependencies") == 0
+
 
 class TestIsAcceptanceCriteria:
     """Tests for acceptance criteria detection."""
@@ -1,7 +1,10 @@
 """Unit tests for spec_ast parser."""
 
+from unittest.mock import patch
+
 from wassden.language_types import Language
-from wassden.lib.spec_ast.blocks import BlockType, ListItemBlock, SectionBlock
+from wassden.lib.spec_ast.blocks import BlockType, ListItemBlock, ReferenceFlags, SectionBlock
+from wassden.lib.spec_ast.id_extractor import IDExtractor
 from wassden.lib.spec_ast.parser import SpecMarkdownParser
 
 
@@ -245,6 +248,57 @@ Content here.
         # Inline code should be included in content
         assert "GET /api/users" in item1.content or "`GET /api/users`" in item1.content
 
+    def test_section_title_ids(self) -> None:
+        """Test that title IDs come from the section title and are looked up once per title."""
+        markdown = """## Overview
+
+### REQ-01: Heading requirement
+
+### TASK-01-01: Heading task
+"""
+        parser = SpecMarkdownParser(Language.ENGLISH)
+        doc = parser.parse(markdown)
+
+        section = doc.children[0]
+        assert isinstance(section, SectionBlock)
+        # Headings with IDs become requirement/task blocks, so parsed sections carry none;
+        # the parser stores the lookups it already made, so reading them runs no extractor
+        with patch.object(IDExtractor, "extract_req_id_from_text") as extract:
+            assert section.title_req_id is None
+            assert section.title_task_id is None
+            extract.assert_not_called()
+        assert doc.children[1].block_type == BlockType.REQUIREMENT
+        assert doc.children[2].block_type == BlockType.TASK
+
+        # Sections built by hand still expose the IDs in their titles
+        manual_req = SectionBlock(line_start=1, line_end=1, raw_content="", title="REQ-02: Manual")
+        manual_task = SectionBlock(line_start=1, line_end=1, raw_content="", title="TASK-01-02: Manual")
+        assert manual_req.title_req_id == "REQ-02"
+        assert manual_task.title_task_id == "TASK-01-02"
+
+        # Lookups are cached per title and redone when the title changes
+        with patch.object(
+            IDExtractor, "extract_req_id_from_text", wraps=IDExtractor.extract_req_id_from_text
+        ) as extract:
+            assert manual_req.title_req_id == "REQ-02"
+            extract.assert_not_called()
+            manual_req.title = "REQ-03: Renamed"
+            assert manual_req.title_req_id == "REQ-03"
+            assert extract.call_count == 1
+
+    def test_parse_stamps_reference_flags(self) -> None:
+        """Test that the parser records document reference flags while building the tree."""
+        markdown = """## Task List
+
+- TASK-01-01: Implement input handling (REQ-01, DC-01)
+- TASK-01-02: Write docs
+"""
+        parser = SpecMarkdownParser(Language.ENGLISH)
+        doc = parser.parse(markdown)
+
+        assert doc.reference_flags == ReferenceFlags(has_task_req_refs=True, has_task_design_refs=True)
+        assert doc.reference_flags == ReferenceFlags.from_blocks(doc.get_all_descendants())
+
 
 class TestParserHelperMethods:
     """Tests for parser helper methods."""
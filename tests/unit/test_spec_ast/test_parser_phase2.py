@@ -227,6 +227,19 @@ class TestTaskExtraction:
         assert "DC-03" in task.design_refs
         assert "DC-05" in task.design_refs
 
+    def test_extract_task_with_dc_field_components(self) -> None:
+        """Test extracting component names from the DC field only."""
+        markdown = """## Task List
+
+- TASK-01-01: Build the pipe-line, DC: **input-handler**, test_input_processing
+"""
+        parser = SpecMarkdownParser(Language.ENGLISH)
+        doc = parser.parse(markdown)
+
+        task = doc.children[0].children[0]
+        assert isinstance(task, TaskBlock)
+        assert task.design_refs == ["input-handler", "test_input_processing"]
+
     def test_extract_task_with_dependencies(self) -> None:
         """Test extracting task with dependencies."""
         markdown = """## Task List
@@ -125,6 +125,11 @@ class TestClassifySection:
         result = classify_section("  Task List  ", "en")
         assert result == SectionType.TASK_LIST
 
+    def test_classify_non_functional_before_functional(self) -> None:
+        """Test that pattern priority survives flattening the title fragments."""
+        assert classify_section("5. 非機能要件", "ja") == SectionType.NON_FUNCTIONAL_REQUIREMENTS
+        assert classify_section("NON-FUNCTIONAL REQUIREMENTS", "en") == SectionType.NON_FUNCTIONAL_REQUIREMENTS
+
 
 class TestGetSectionPattern:
     """Tests for getting section patterns."""
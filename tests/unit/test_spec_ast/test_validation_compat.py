@@ -1,11 +1,16 @@
 """Tests for validation compatibility layer."""
 
+import re
+
 from wassden.language_types import Language
 from wassden.lib.spec_ast.parser import SpecMarkdownParser
 from wassden.lib.spec_ast.validation_compat import (
+    _is_component_name,
+    _parse_reference_document,
     convert_validation_results_to_dict,
     convert_validation_results_to_errors,
     extract_found_sections,
+    extract_missing_references_from_results,
     extract_stats_from_document,
     validate_design_ast,
     validate_design_structure_ast,
@@ -234,6 +239,57 @@ class TestConvertValidationResults:
         assert "Error message" in result_dict["issues"]
 
 
+class TestExtractMissingReferences:
+    """Tests for extract_missing_references_from_results function."""
+
+    def test_extract_missing_references_by_type(self):
+        """Test that each error message format is routed to the right bucket."""
+        messages = [
+            "Requirements not referenced in tasks: REQ-02, NFR-01, TR-01...",
+            "Missing references to requirements: REQ-01, REQ-02",
+            "Test requirement not referenced: TR-03",
+            "Design components not referenced in tasks: input-handler, Bad Name, data_store",
+            "Test scenario not referenced in tasks: test-input-processing",
+            "Requirements not referenced - tasks reference REQ-IDs but requirements.md is missing",
+            "Missing required section: Overview",
+        ]
+        result = ValidationResult(
+            rule_id="TEST-001",
+            rule_name="Test Rule",
+            is_valid=False,
+            errors=[ValidationError(message=message) for message in messages],
+        )
+
+        missing = extract_missing_references_from_results([result])
+
+        assert missing["requirements"] == ["NFR-01", "REQ-01", "REQ-02"]
+        assert missing["test_requirements"] == ["TR-01", "TR-03"]
+        assert missing["design"] == ["data_store", "input-handler", "test-input-processing"]
+
+    def test_component_name_check_matches_regex(self):
+        """Test that the component name scanner agrees with the original regex."""
+        pattern = re.compile(r"^[a-z][a-z0-9]*(?:[-_][a-z0-9]+)+$")
+        candidates = [
+            "input-handler",
+            "data_store",
+            "test-input-processing",
+            "a1-b2_c3",
+            "auth",
+            "Auth-service",
+            "1st-component",
+            "auth--service",
+            "auth-",
+            "-auth",
+            "auth-Service",
+            "auth service",
+            "auth-sérvice",
+            "",
+            "x-0",
+        ]
+        for candidate in candidates:
+            assert _is_component_name(candidate) == bool(pattern.match(candidate)), candidate
+
+
 class TestValidateRequirementsStructureAST:
     """Tests for validate_requirements_structure_ast function."""
 
@@ -458,6 +514,26 @@ Design for requirement."""
         # Check stats
         assert result["stats"]["referencedRequirements"] == 1
 
+    def test_requirements_context_not_reused_between_calls(self):
+        """Test that requirements from a previous call do not leak into the next validation."""
+        content = """# Design
+
+## Traceability
+
+- REQ-01 ⇔ input-handler"""
+        requirements = """# Requirements
+
+## Functional Requirements
+
+- REQ-01: The system shall accept input.
+- REQ-02: The system shall store input."""
+
+        with_reqs = validate_design_ast(content, requirements, Language.ENGLISH)
+        without_reqs = validate_design_ast(content, None, Language.ENGLISH)
+
+        assert any("REQ-02" in issue for issue in with_reqs["issues"])
+        assert not any("REQ-02" in issue for issue in without_reqs["issues"])
+
 
 class TestValidateTasksAST:
     """Tests for validate_tasks_ast function."""
@@ -496,3 +572,23 @@ Milestones content."""
         assert result["stats"]["totalTasks"] == 2
         # Dependencies may be 0 until parser captures task attributes
         assert result["stats"]["dependencies"] >= 0
+
+    def test_reference_documents_parsed_once_across_calls(self):
+        """Test that a requirements document shared by design and tasks validation is parsed once."""
+        requirements = """## Functional Requirements
+
+- REQ-01: The system shall accept reference caching input."""
+        design = """## Traceability
+
+- REQ-01 ⇔ input-handler"""
+        content = """## Task List
+
+- TASK-01-01: Implement input handler (REQ-01)"""
+
+        _parse_reference_document.cache_clear()
+        validate_design_ast(design, requirements, Language.ENGLISH)
+        validate_tasks_ast(content, requirements, design, Language.ENGLISH)
+
+        info = _parse_reference_document.cache_info()
+        assert info.misses == 2  # requirements and design, each parsed once
+        assert info.hits == 1
@@ -4,10 +4,11 @@ import pytest
 
 from wassden.language_types import Language
 from wassden.lib.spec_ast.blocks import DocumentBlock, SectionBlock
-from wassden.lib.spec_ast.document_styles import REQUIREMENTS_STYLE, DocumentStyle
+from wassden.lib.spec_ast.document_styles import REQUIREMENTS_STYLE, TASKS_STYLE, DocumentStyle
+from wassden.lib.spec_ast.parser import SpecMarkdownParser
 from wassden.lib.spec_ast.section_patterns import SectionType
 from wassden.lib.spec_ast.structure_rules import RequirementsStructureRule
-from wassden.lib.spec_ast.validation_engine import ValidationEngine
+from wassden.lib.spec_ast.validation_engine import ValidationEngine, _get_rules
 
 
 class TestValidationEngine:
@@ -117,6 +118,23 @@ class TestValidationEngine:
         assert summary["isValid"] is False  # Missing sections
         assert summary["totalRules"] == len(results)
         assert summary["totalErrors"] > 0
+        assert summary["passedRules"] == sum(1 for result in results if result.is_valid)
+        assert summary["skippedRules"] == 0
+        assert summary["passedRules"] + summary["failedRules"] == summary["totalRules"]
+        assert summary["totalErrors"] == len(summary["errors"])
+        assert summary["results"] == [result.to_dict() for result in results]
+
+    def test_get_validation_summary_without_results(self):
+        """Test that include_results=False skips per-result serialization only."""
+        engine = ValidationEngine()
+        document = DocumentBlock(line_start=1, line_end=100, raw_content="# Requirements")
+        results = engine.validate_requirements(document)
+
+        full = engine.get_validation_summary(results)
+        minimal = engine.get_validation_summary(results, include_results=False)
+
+        assert "results" not in minimal
+        assert minimal == {key: value for key, value in full.items() if key != "results"}
 
     def test_set_context_documents(self):
         """Test setting context documents for cross-reference validation."""
@@ -134,6 +152,56 @@ class TestValidationEngine:
         assert engine.context.design_doc is design_doc
         assert engine.context.tasks_doc is tasks_doc
 
+    def test_rules_cached_per_style_and_language(self):
+        """Test that rule instances are created once and shared between engines."""
+        rules = _get_rules(REQUIREMENTS_STYLE, Language.ENGLISH)
+
+        assert _get_rules(REQUIREMENTS_STYLE, Language.ENGLISH) is rules
+        assert [type(rule) for rule in rules] == REQUIREMENTS_STYLE.validation_rules
+        assert all(rule.language == Language.ENGLISH for rule in rules)
+        assert _get_rules(REQUIREMENTS_STYLE, Language.JAPANESE) is not rules
+
+        custom_style = DocumentStyle(
+            name=REQUIREMENTS_STYLE.name,
+            description="Same name, different rules",
+            required_sections=[],
+            validation_rules=[RequirementsStructureRule],
+        )
+        assert [type(rule) for rule in _get_rules(custom_style, Language.ENGLISH)] == [RequirementsStructureRule]
+
+    def test_fail_fast_skips_rules_after_structure_failure(self):
+        """Test that fail-fast mode skips only rules depending on a failed structure rule."""
+        markdown = """## Task List
+
+- TASK-1: Malformed task for REQ-01.
+"""
+        document = SpecMarkdownParser(Language.ENGLISH).parse(markdown)
+
+        full = ValidationEngine(Language.ENGLISH).validate_tasks(document)
+        engine = ValidationEngine(Language.ENGLISH, fail_fast=True)
+        fail_fast = engine.validate_tasks(document)
+        rules = _get_rules(TASKS_STYLE, Language.ENGLISH)
+
+        assert [result.rule_id for result in fail_fast] == [result.rule_id for result in full]
+        structure = fail_fast[0]
+        assert not structure.is_valid
+        for rule, result, reference in zip(rules, fail_fast, full, strict=True):
+            if structure.rule_id in rule.depends_on:
+                assert result.skipped
+                assert result.is_valid
+                assert not result.errors
+            else:
+                assert result == reference
+        # ID format errors are still reported when the structure rule fails
+        assert any(not result.is_valid and not result.skipped for result in fail_fast[1:])
+
+        summary = engine.get_validation_summary(fail_fast)
+        skipped = sum(result.skipped for result in fail_fast)
+        assert skipped > 0
+        assert summary["skippedRules"] == skipped
+        assert summary["passedRules"] == sum(result.is_valid and not result.skipped for result in fail_fast)
+        assert summary["passedRules"] + summary["failedRules"] + skipped == summary["totalRules"]
+
     def test_validate_requirements_missing_sections(self):
         """Test validating requirements with missing sections."""
         engine = ValidationEngine()
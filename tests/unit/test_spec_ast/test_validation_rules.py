@@ -1,5 +1,9 @@
 """Tests for validation rule base classes."""
 
+from dataclasses import FrozenInstanceError
+
+import pytest
+
 from wassden.language_types import Language
 from wassden.lib.spec_ast.blocks import DocumentBlock, SectionBlock
 from wassden.lib.spec_ast.validation_rules import (
@@ -8,6 +12,7 @@ from wassden.lib.spec_ast.validation_rules import (
     ValidationContext,
     ValidationError,
     ValidationResult,
+    ValidationRule,
 )
 
 
@@ -73,6 +78,13 @@ class TestValidationResult:
         assert result_dict["rule_name"] == "Test Rule"
         assert result_dict["is_valid"] is True
         assert result_dict["errors"] == []
+        assert "skipped" not in result_dict
+
+    def test_to_dict_skipped(self):
+        """Test that only results skipped in fail-fast mode carry the skipped key."""
+        result = ValidationResult(rule_id="TEST-003", rule_name="Test Rule 3", is_valid=True, skipped=True)
+
+        assert result.to_dict()["skipped"] is True
 
     def test_to_dict_with_errors(self):
         """Test converting result to dict with errors."""
@@ -90,6 +102,14 @@ class TestValidationResult:
         assert result_dict["errors"][0]["message"] == "Error 1"
         assert result_dict["errors"][1]["message"] == "Error 2"
 
+    def test_result_objects_use_slots(self):
+        """Test that per-error result objects carry no instance __dict__."""
+        error = ValidationError(message="Error", location=BlockLocation(line_start=1, line_end=1))
+        result = ValidationResult(rule_id="TEST-003", rule_name="Test Rule 3", is_valid=False, errors=[error])
+
+        for obj in (error, error.location, result):
+            assert not hasattr(obj, "__dict__")
+
 
 class TestValidationContext:
     """Tests for ValidationContext class."""
@@ -118,3 +138,58 @@ class TestValidationContext:
         assert context.requirements_doc is req_doc
         assert context.design_doc is design_doc
         assert context.tasks_doc is tasks_doc
+
+
+class _CountingRule(ValidationRule):
+    """Minimal rule reporting one error per requested failure."""
+
+    def __init__(self, failures: int = 0) -> None:
+        super().__init__()
+        self.failures = failures
+
+    @property
+    def rule_id(self) -> str:
+        return "TEST-RULE"
+
+    @property
+    def rule_name(self) -> str:
+        return "Test Rule"
+
+    @property
+    def description(self) -> str:
+        return "Rule used in tests"
+
+    def validate(self, document: DocumentBlock, context: ValidationContext) -> ValidationResult:  # noqa: ARG002
+        return self._create_result([ValidationError(message=f"Error {i}") for i in range(self.failures)])
+
+
+class TestValidationRule:
+    """Tests for ValidationRule base class helpers."""
+
+    def test_passing_result_is_shared(self):
+        """Test that error-free runs reuse one immutable result."""
+        rule = _CountingRule()
+        document = DocumentBlock(line_start=1, line_end=1, raw_content="")
+        context = ValidationContext()
+
+        first = rule.validate(document, context)
+        second = rule.validate(document, context)
+
+        assert first is second
+        assert first.is_valid is True
+        assert first.errors == ()
+        assert first.rule_id == "TEST-RULE"
+        with pytest.raises(FrozenInstanceError):
+            first.skipped = True  # type: ignore[misc]
+
+    def test_failing_result_is_fresh(self):
+        """Test that results with errors are created per call."""
+        rule = _CountingRule(failures=2)
+        document = DocumentBlock(line_start=1, line_end=1, raw_content="")
+        context = ValidationContext()
+
+        first = rule.validate(document, context)
+
+        assert first.is_valid is False
+        assert len(first.errors) == 2
+        assert rule.validate(document, context) is not first
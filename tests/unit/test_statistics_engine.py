@@ -4,13 +4,21 @@ Tests for TASK-01-03 statistical calculation functionality.
 """
 
 import math
+import timeit
 
+import numpy as np
 import pytest
+from scipy import stats
 
 from wassden.lib.statistics_engine import (
+    _T_CRITICAL_CACHE,
+    PURE_PYTHON_STATS_MAX_N,
     InsufficientDataError,
     InvalidDataError,
     StatisticsEngine,
+    _prime_t_critical,
+    _t_critical,
+    _z_critical,
 )
 
 
@@ -58,6 +66,69 @@ class TestStatisticsEngine:
         # Confidence interval should be wider than ±1 standard error
         assert upper - lower > 0  # Should have non-zero width
 
+    def test_critical_values_memoized(self):
+        """Test that critical values match SciPy and are served from the cache on reuse."""
+        assert _t_critical(0.95, 9) == pytest.approx(stats.t.ppf(0.975, 9))
+        assert _z_critical(0.95) == pytest.approx(stats.norm.ppf(0.975))
+
+        assert _T_CRITICAL_CACHE[(0.95, 9)] == _t_critical(0.95, 9)
+
+    def test_prime_t_critical_matches_scalar_values(self):
+        """Test that batch-computed t critical values equal the per-call values."""
+        dfs = [101, 102, 103]
+        for df in dfs:
+            _T_CRITICAL_CACHE.pop((0.9, df), None)
+
+        _prime_t_critical(0.9, dfs)
+
+        for df in dfs:
+            assert _T_CRITICAL_CACHE[(0.9, df)] == pytest.approx(stats.t.ppf(0.95, df), rel=1e-12)
+
+    def test_small_sample_path_matches_numpy_path(self):
+        """Test that the pure-Python small-sample statistics agree with the numpy path."""
+        datasets = (
+            [4.0],
+            [1.5, 2.5],
+            [10.5, 15.3, 20.1, 25.7, 30.9],
+            [float(i) ** 1.5 for i in range(31)],
+            [float(i) ** 1.5 for i in range(PURE_PYTHON_STATS_MAX_N)],
+        )
+        for data in datasets:
+            small = StatisticsEngine.calculate_descriptive_stats(data)
+            reference, _ = StatisticsEngine._stats_with_array(data)
+
+            assert small.sample_size == reference.sample_size
+            assert small.mean == pytest.approx(reference.mean, rel=1e-12)
+            assert small.variance == pytest.approx(reference.variance, rel=1e-12)
+            assert small.min_value == reference.min_value
+            assert small.max_value == reference.max_value
+            assert small.confidence_interval == pytest.approx(reference.confidence_interval, rel=1e-12)
+
+    def test_small_sample_path_faster_up_to_threshold(self):
+        """Test that the pure-Python path is still faster than the numpy path at the size threshold."""
+        data = [float(i) ** 1.5 for i in range(PURE_PYTHON_STATS_MAX_N)]
+
+        small = min(timeit.repeat(lambda: StatisticsEngine._small_sample_stats(data), number=20, repeat=5))
+        reference = min(timeit.repeat(lambda: StatisticsEngine._stats_with_array(data), number=20, repeat=5))
+
+        assert small < reference
+
+    def test_numpy_array_input(self):
+        """Test that numpy arrays are accepted and validated without a per-value loop."""
+        data = [1.0, 2.0, 3.0, 4.0, 5.0]
+
+        from_array = StatisticsEngine.calculate_descriptive_stats(np.array(data))
+        from_list = StatisticsEngine.calculate_descriptive_stats(data)
+
+        assert from_array.mean == pytest.approx(from_list.mean)
+        assert from_array.variance == pytest.approx(from_list.variance)
+        assert from_array.confidence_interval == pytest.approx(from_list.confidence_interval)
+
+        with pytest.raises(InvalidDataError, match="Invalid numeric value"):
+            StatisticsEngine.calculate_descriptive_stats(np.array([1.0, np.nan]))
+        with pytest.raises(InsufficientDataError, match="empty dataset"):
+            StatisticsEngine.calculate_descriptive_stats(np.array([]))
+
     def test_confidence_interval_single_point(self):
         """Test confidence interval for single data point."""
         data = [5.0]
@@ -86,6 +157,14 @@ class TestStatisticsEngine:
         with pytest.raises(InvalidDataError, match="Non-numeric value"):
             StatisticsEngine.calculate_descriptive_stats([1.0, "invalid", 3.0])
 
+        # Test with missing value
+        with pytest.raises(InvalidDataError, match="Non-numeric value found: None"):
+            StatisticsEngine.calculate_descriptive_stats([1.0, None, 3.0])
+
+        # Test with nested value
+        with pytest.raises(InvalidDataError, match="Non-numeric value"):
+            StatisticsEngine.calculate_descriptive_stats([[1.0, 2.0], [3.0, 4.0]])
+
     def test_large_dataset_precision(self):
         """Test statistical calculations with larger dataset for precision."""
         # Generate data with known statistical properties
@@ -128,6 +207,16 @@ class TestStatisticsEngine:
         assert "significant" in t_test
         assert isinstance(t_test["significant"], bool)
 
+    def test_compare_datasets_f_test(self):
+        """Test that the F-test uses the ratio of sample variances."""
+        baseline = [1.0, 2.0, 3.0, 4.0, 5.0]
+        comparison = [2.0, 4.0, 6.0, 8.0, 10.0]  # Twice the spread
+
+        f_test = StatisticsEngine.compare_datasets(baseline, comparison)["f_test"]
+
+        assert f_test["f_statistic"] == pytest.approx(4.0)
+        assert 0.0 < f_test["p_value"] <= 1.0
+
     def test_compare_datasets_insufficient_data(self):
         """Test comparison with insufficient data."""
         baseline = [1.0]  # Only one point
@@ -159,6 +248,25 @@ class TestStatisticsEngine:
         assert "outliers" in outliers
         assert "outlier_count" in outliers
 
+    def test_validate_assumptions_detects_outliers(self):
+        """Test IQR outlier detection reports the values outside the fences."""
+        data = [10.0, 11.0, 12.0, 11.0, 10.0, 12.0, 11.0, 100.0, -50.0, 11.0]
+
+        outliers = StatisticsEngine.validate_statistical_assumptions(data)["outlier_detection"]
+
+        assert outliers["outliers"] == [100.0, -50.0]
+        assert outliers["outlier_count"] == 2
+        assert outliers["outlier_percentage"] == pytest.approx(20.0)
+
+    def test_outlier_fences_use_interpolated_quartiles(self):
+        """Test that IQR fences come from linearly interpolated quartiles."""
+        data = [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0]  # Q1 = 2.75, Q3 = 6.25
+
+        outliers = StatisticsEngine.validate_statistical_assumptions(data)["outlier_detection"]
+
+        assert outliers["lower_bound"] == pytest.approx(2.75 - 1.5 * 3.5)
+        assert outliers["upper_bound"] == pytest.approx(6.25 + 1.5 * 3.5)
+
     def test_validate_assumptions_insufficient_data(self):
         """Test assumptions validation with insufficient data."""
         data = [1.0, 2.0]  # Only 2 points
@@ -198,6 +306,33 @@ class TestStatisticsEngine:
         assert metric_a_stats["mean"] == 2.0  # (1+2+3)/3
         assert metric_a_stats["sample_size"] == 3
 
+    def test_aggregate_skips_non_finite_and_non_numeric_values(self):
+        """Test that aggregation only collects finite numeric values per metric."""
+        results = [
+            {"metric_a": 1.0, "metric_b": float("nan"), "status": "completed"},
+            {"metric_a": float("inf"), "metric_b": 4, "status": "completed"},
+            {"metric_a": 3.0, "metric_b": 6, "status": "failed"},
+        ]
+
+        aggregated = StatisticsEngine.aggregate_experiment_results(results)
+
+        assert aggregated["metrics_analyzed"] == ["metric_a", "metric_b"]
+        assert aggregated["statistics"]["metric_a"]["sample_size"] == 2
+        assert aggregated["statistics"]["metric_b"]["mean"] == 5.0
+
+    def test_aggregate_accepts_numpy_scalar_metrics(self):
+        """Test that numpy integer and floating scalars count as numeric metrics."""
+        results = [
+            {"metric_a": np.int64(1), "metric_b": np.float32(2.5), "flag": np.bool_(True)},
+            {"metric_a": np.int32(3), "metric_b": np.float32(np.nan), "flag": np.bool_(False)},
+        ]
+
+        aggregated = StatisticsEngine.aggregate_experiment_results(results)
+
+        assert aggregated["metrics_analyzed"] == ["metric_a", "metric_b"]
+        assert aggregated["statistics"]["metric_a"]["mean"] == 2.0
+        assert aggregated["statistics"]["metric_b"]["sample_size"] == 1
+
     def test_aggregate_no_results(self):
         """Test aggregation with no results."""
         with pytest.raises(InsufficientDataError, match="No experiment results"):
@@ -215,6 +350,11 @@ class TestStatisticsEngine:
         assert StatisticsEngine._interpret_effect_size(-0.3) == "small"
         assert StatisticsEngine._interpret_effect_size(-1.0) == "large"
 
+        # Boundary values belong to the next band up
+        assert StatisticsEngine._interpret_effect_size(0.2) == "small"
+        assert StatisticsEngine._interpret_effect_size(0.5) == "medium"
+        assert StatisticsEngine._interpret_effect_size(0.8) == "large"
+
     def test_statistical_precision_requirements(self):
         """Test that calculations meet precision requirements."""
         # Test with data that has exact known statistics
@@ -1,7 +1,16 @@
 """Unit tests for traceability functions."""
 
 from wassden.lib import traceability
-from wassden.lib.validation_common import check_tr_coverage, extract_test_scenarios, extract_tr_ids
+from wassden.lib.validation_common import (
+    check_circular_dependencies,
+    check_requirement_coverage_with_threshold,
+    check_tr_coverage,
+    extract_kpi_ids,
+    extract_nfr_ids,
+    extract_task_dependencies,
+    extract_test_scenarios,
+    extract_tr_ids,
+)
 
 # Test constants
 MAX_COVERAGE_PERCENTAGE = 100
@@ -29,6 +38,15 @@ def test_extract_task_ids():
     assert traceability.extract_task_ids(None) == set()
 
 
+def test_extract_ids_after_embedded_prefix():
+    """Test that an embedded first prefix does not hide or admit IDs."""
+    content = "See xREQ-01, TASKS-01 and NTR-01 before REQ-02, TR-03 and TASK-04-01"
+    assert traceability.extract_req_ids(content) == {"REQ-02"}
+    assert traceability.extract_task_ids(content) == {"TASK-04-01"}
+    assert extract_tr_ids(content) == {"TR-03"}
+    assert extract_tr_ids("No test requirements here") == set()
+
+
 def test_extract_design_components():
     """Test design component extraction."""
     content = """
@@ -80,6 +98,52 @@ def test_extract_tr_ids():
     assert extract_tr_ids("") == set()
 
 
+def test_validation_common_extract_nfr_and_kpi_ids():
+    """Test NFR/KPI extraction, including documents without either prefix."""
+    content = "NFR-01 and xNFR-02 apply; KPI-03 tracks NFR-04. KPI-5 is malformed"
+    assert extract_nfr_ids(content) == {"NFR-01", "NFR-04"}
+    assert extract_kpi_ids(content) == {"KPI-03"}
+    assert extract_nfr_ids("REQ-01 only") == set()
+    assert extract_kpi_ids("") == set()
+    assert extract_kpi_ids(None) == set()
+
+
+def test_validation_common_extract_task_dependencies():
+    """Test that only single-colon dependency lines are parsed."""
+    content = (
+        "- TASK-01-02 依存: TASK-01-01\n"
+        "- TASK-02-01 Depends on: TASK-01-01, TASK-01-02\n"
+        "- TASK-03-01 依存: TASK-01-01: extra colon\n"
+        "- TASK-04-01: no dependency here\n"
+    )
+    assert extract_task_dependencies(content) == {
+        "TASK-01-02": ["TASK-01-01"],
+        "TASK-02-01": ["TASK-01-01", "TASK-01-02"],
+    }
+
+
+def test_validation_common_check_circular_dependencies():
+    """Test that each mutually dependent pair is reported once."""
+    dependencies = {
+        "TASK-01-01": ["TASK-01-02", "TASK-01-02"],
+        "TASK-01-02": ["TASK-01-01"],
+        "TASK-01-03": ["TASK-01-01"],
+    }
+    assert check_circular_dependencies(dependencies) == [
+        "Circular dependency detected: TASK-01-01 <-> TASK-01-02",
+    ]
+    assert check_circular_dependencies({"TASK-01-01": ["TASK-01-02"], "TASK-01-02": []}) == []
+
+
+def test_check_requirement_coverage_with_threshold_display():
+    """Test that the error lists the lowest missing IDs regardless of set order."""
+    all_requirements = {f"REQ-{i:02d}" for i in range(1, 11)}
+    errors, missing = check_requirement_coverage_with_threshold(all_requirements, {"REQ-01"})
+
+    assert errors == ["Requirements not referenced in tasks: REQ-02, REQ-03, REQ-04, REQ-05, REQ-06..."]
+    assert sorted(missing) == sorted(all_requirements - {"REQ-01"})
+
+
 def test_check_tr_coverage():
     """Test TR coverage checking."""
     all_trs = {"TR-01", "TR-02", "TR-03"}
@@ -117,6 +181,67 @@ def test_build_traceability_matrix(sample_requirements, sample_design, sample_ta
     assert "task_dependencies" in matrix
 
 
+def test_build_traceability_matrix_returns_independent_copies(sample_requirements, sample_design, sample_tasks):
+    """Test that memoized matrices are copied so callers cannot corrupt the cache."""
+    first = traceability.build_traceability_matrix(sample_requirements, sample_design, sample_tasks)
+    first["requirements"].add("REQ-99")
+    next(iter(first["req_to_design"].values())).add("injected")
+
+    second = traceability.build_traceability_matrix(sample_requirements, sample_design, sample_tasks)
+    assert "REQ-99" not in second["requirements"]
+    assert all("injected" not in names for names in second["req_to_design"].values())
+    assert second["requirements"] is not first["requirements"]
+
+
+def test_req_to_design_mapping_stops_at_boundaries():
+    """Test that each REQ mention owns only the components up to the next REQ or heading."""
+    requirements = "- REQ-01: First\n- REQ-02: Second\n- REQ-03: Third"
+    design = """## Architecture
+REQ-01 is handled by **input-handler** and **validator**.
+REQ-02 uses **output-handler**.
+## Data
+**storage** stands alone.
+REQ-01 also relies on **cache**.
+"""
+    matrix = traceability.build_traceability_matrix(requirements, design, None)
+
+    assert matrix["req_to_design"] == {
+        "REQ-01": {"input-handler", "validator", "cache"},
+        "REQ-02": {"output-handler"},
+    }
+
+
+def test_design_to_tasks_mapping_links_next_task():
+    """Test that each component mention links to the first task ID after it."""
+    design = "## Components\n- **input-handler**: Input\n- **output-handler**: Output\n- **unused**: Nothing"
+    tasks = """- input-handler setup: TASK-01-01
+- TASK-01-02: wire output-handler into TASK-02-01
+- input-handler tests: TASK-03-01
+"""
+    matrix = traceability.build_traceability_matrix(None, design, tasks)
+
+    assert matrix["design_to_tasks"] == {
+        "input-handler": {"TASK-01-01", "TASK-03-01"},
+        "output-handler": {"TASK-02-01"},
+    }
+
+
+def test_extract_task_dependencies_from_dependency_lines():
+    """Test that only dependency lines contribute, in either language and any case."""
+    tasks = """- TASK-01-01: Setup
+- TASK-01-02: Build parser (Depends on TASK-01-01)
+- TASK-02-01 依存: TASK-01-02, TASK-01-01
+- TASK-02-02: Mentions TASK-01-01 without a dependency keyword
+- TASK-02-03 depends: TASK-02-03
+"""
+    matrix = traceability.build_traceability_matrix(None, None, tasks)
+
+    assert matrix["task_dependencies"] == {
+        "TASK-01-02": {"TASK-01-01"},
+        "TASK-02-01": {"TASK-01-01", "TASK-01-02"},
+    }
+
+
 def test_check_circular_dependencies():
     """Test circular dependency detection."""
     # No circular dependencies
@@ -138,6 +263,17 @@ def test_check_circular_dependencies():
     assert len(errors) > 0
 
 
+def test_check_circular_dependencies_deep_chain():
+    """Test that long dependency chains do not hit the recursion limit."""
+    chain_length = 5000
+    deps = {f"TASK-{i}": {f"TASK-{i + 1}"} for i in range(chain_length)}
+    assert traceability.check_circular_dependencies(deps) == []
+
+    deps[f"TASK-{chain_length}"] = {"TASK-0"}
+    errors = traceability.check_circular_dependencies(deps)
+    assert errors == [f"Circular dependency: TASK-{chain_length} -> TASK-0"]
+
+
 def test_calculate_coverage_metrics(sample_requirements, sample_design, sample_tasks):
     """Test coverage metrics calculation."""
     matrix = traceability.build_traceability_matrix(sample_requirements, sample_design, sample_tasks)
@@ -20,6 +20,8 @@ def test_validate_req_id():
     assert validate.validate_req_id("REQ-1") is False
     assert validate.validate_req_id("REQ01") is False
     assert validate.validate_req_id("REQ") is False
+    assert validate.validate_req_id("REQ-00") is False
+    assert validate.validate_req_id("NFR-01") is False
 
 
 def test_validate_task_id():
@@ -30,6 +32,18 @@ def test_validate_task_id():
     assert validate.validate_task_id("TASK-01") is False
     assert validate.validate_task_id("TASK-01-01-01-01") is False
     assert validate.validate_task_id("TASK01-01") is False
+    assert validate.validate_task_id("TASK-01-00") is False
+    assert validate.validate_task_id("TASK-01-1a") is False
+
+
+def test_id_validators_cached():
+    """Test that repeated ID checks are answered from the validators' caches."""
+    for _ in range(2):
+        assert validate.validate_req_id("REQ-42") is True
+        assert validate.validate_task_id("TASK-42-42") is True
+
+    assert validate.validate_req_id.cache_info().hits >= 1
+    assert validate.validate_task_id.cache_info().hits >= 1
 
 
 def test_validate_requirements(sample_requirements):
@@ -59,6 +73,20 @@ def test_validate_tasks(sample_tasks, sample_requirements, sample_design):
     assert result["stats"]["dependencies"] >= 0
 
 
+def test_validate_results_cached_per_input(sample_requirements):
+    """Test that repeated validation reuses the cached result without sharing it."""
+    first = validate.validate_requirements(sample_requirements)
+    is_valid = first["isValid"]
+    first["issues"].append("caller-added issue")
+    first["isValid"] = not is_valid
+    second = validate.validate_requirements(sample_requirements)
+
+    assert validate._validate_requirements_cached.cache_info().hits >= 1
+    assert "caller-added issue" not in second["issues"]
+    assert second["isValid"] is is_valid
+    assert second is not first
+
+
 def test_validate_tasks_missing_test_scenarios():
     """Test tasks validation when test scenarios are not referenced."""
     requirements_content = """
@@ -1,5 +1,8 @@
 """Unit tests for EARS validation module."""
 
+from unittest.mock import patch
+
+from wassden.lib import validate_ears
 from wassden.lib.validate_ears import EARSValidator
 from wassden.types import Language
 
@@ -41,6 +44,20 @@ class TestEARSValidator:
         assert len(result.violations) == 3
         assert "「システムは」または「本システムは」で始まっていません" in result.violations[0].reason
 
+    def test_validate_ubiquitous_japanese_requires_body(self) -> None:
+        """Test that Japanese requirements need text between the subject and the suffix."""
+        requirements = [
+            "システムはする。",  # No action between prefix and suffix
+            "システムはあること",  # Suffix only
+            "システムは保存\nすること。",  # Spans lines
+            "システムはアること。",  # Katakana before こと is not a ること suffix
+        ]
+        result = self.validator.validate_ubiquitous(requirements)
+
+        assert result.total == 4
+        assert result.matched == 0
+        assert len(result.violations) == 4
+
     def test_validate_ubiquitous_english_valid(self) -> None:
         """Test valid English Ubiquitous patterns."""
         # Create validator with English language
@@ -194,6 +211,24 @@ System overview.
         assert not any("REQ:" in req for req in requirements), "REQ: prefix should be stripped"
         assert not any("REQ-:" in req for req in requirements), "REQ-: prefix should be stripped"
 
+    def test_extract_requirements_without_functional_section(self) -> None:
+        """Test that documents without a functional requirements header skip markdown conversion."""
+        markdown = """# 設計書
+
+## 概要
+- システムはユーザー認証を行うこと。
+"""
+        with patch("wassden.lib.validate_ears.markdown.Markdown.convert") as convert:
+            assert self.validator.extract_requirements_from_markdown(markdown) == []
+            convert.assert_not_called()
+
+        # Header detection is case-insensitive, like the HTML extraction
+        validator = EARSValidator(Language.ENGLISH)
+        requirements = validator.extract_requirements_from_markdown(
+            "## FUNCTIONAL REQUIREMENTS\n\n- The system shall log events.\n"
+        )
+        assert requirements == ["The system shall log events."]
+
     def test_result_to_dict(self) -> None:
         """Test converting result to dictionary format."""
         requirements = ["Invalid requirement"]
@@ -209,3 +244,15 @@ System overview.
         assert "line" in result_dict["ears"]["violations"][0]
         assert "reason" in result_dict["ears"]["violations"][0]
         assert "text" in result_dict["ears"]["violations"][0]
+
+
+def test_validate_ears_in_content_cached_per_input() -> None:
+    """Test that repeated EARS validation reuses the cached result without sharing it."""
+    content = "## 機能要件\n- システムはログを記録すること。\n- ログを記録する\n"
+    first = validate_ears.validate_ears_in_content(content)
+    first.violations.clear()
+    second = validate_ears.validate_ears_in_content(content)
+
+    assert validate_ears._validate_ears_cached.cache_info().hits >= 1
+    assert len(second.violations) == 1
+    assert second is not first
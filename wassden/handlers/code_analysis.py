@@ -6,6 +6,10 @@ from typing import Any
 from wassden.i18n import get_i18n
 from wassden.types import HandlerResponse, SpecDocuments, TextContent
 
+_PHASE_HEADING = "## Phase"
+# Use both Japanese and English patterns to find requirements
+_REQUIREMENT_DETAIL_PATTERNS = ("システムは", "テスト", "system", "test", "shall", "should", "must")
+
 
 async def handle_prompt_code(
     specs: SpecDocuments,
@@ -174,27 +178,37 @@ async def handle_generate_review_prompt(
 
 def _extract_task_info(tasks_content: str, task_id: str) -> dict[str, str] | None:
     """Extract task information for specified task ID from tasks.md."""
-    lines = tasks_content.split("\n")
-    task_info = {}
-    current_phase = ""
-
-    for line in lines:
-        # Extract phase
-        if line.startswith("## Phase"):
-            current_phase = line.strip()
-            continue
-
-        # Find task line
-        if task_id in line and "TASK-" in line:
-            task_info["phase"] = current_phase
-            # Extract task summary (everything after task ID)
-            parts = line.split(task_id)
-            if len(parts) > 1:
-                summary = parts[1].strip().lstrip(":")
-                task_info["summary"] = summary
-            return task_info
-
-    return None
+    # Jump between occurrences of the task ID instead of splitting the whole document into lines
+    start = tasks_content.find(task_id)
+    while start != -1:
+        line_start = tasks_content.rfind("\n", 0, start) + 1
+        line_end = tasks_content.find("\n", start)
+        if line_end == -1:
+            line_end = len(tasks_content)
+        line = tasks_content[line_start:line_end]
+        # Find task line (phase headings are not task lines)
+        if not line.startswith(_PHASE_HEADING) and "TASK-" in line:
+            break
+        start = tasks_content.find(task_id, line_end + 1)
+    else:
+        return None
+
+    task_info = {"phase": _find_current_phase(tasks_content, line_start)}
+    # Extract task summary (everything after task ID)
+    parts = line.split(task_id)
+    if len(parts) > 1:
+        summary = parts[1].strip().lstrip(":")
+        task_info["summary"] = summary
+    return task_info
+
+
+def _find_current_phase(tasks_content: str, line_start: int) -> str:
+    """Find the last phase heading before the line starting at line_start."""
+    phase_start = tasks_content.rfind("\n" + _PHASE_HEADING, 0, line_start) + 1
+    if not phase_start and not tasks_content.startswith(_PHASE_HEADING):
+        return ""
+    phase_end = tasks_content.find("\n", phase_start)
+    return tasks_content[phase_start:phase_end].strip()
 
 
 def _extract_related_requirements(task_info: dict[str, str], requirements_content: str) -> list[str]:
@@ -239,13 +253,18 @@ def _extract_related_test_requirements(task_info: dict[str, str], requirements_c
 
 def _find_requirement_detail(requirements_content: str, req_id: str) -> str | None:
     """Find requirement detail by ID."""
-    lines = requirements_content.split("\n")
-    # Use both Japanese and English patterns to find requirements
-    requirement_patterns = ["システムは", "テスト", "system", "test", "shall", "should", "must"]
-    for line in lines:
-        if req_id in line and any(pattern in line.lower() for pattern in requirement_patterns):
+    # Jump between occurrences of the ID instead of splitting the whole document into lines
+    start = requirements_content.find(req_id)
+    while start != -1:
+        line_start = requirements_content.rfind("\n", 0, start) + 1
+        line_end = requirements_content.find("\n", start)
+        if line_end == -1:
+            line_end = len(requirements_content)
+        line = requirements_content[line_start:line_end]
+        if any(pattern in line.lower() for pattern in _REQUIREMENT_DETAIL_PATTERNS):
             # Extract requirement text
             return line.strip()
+        start = requirements_content.find(req_id, line_end + 1)
     return None
 
 
@@ -8,6 +8,7 @@ from wassden.lib.spec_ast.blocks import (
     BlockType,
     DocumentBlock,
     ListItemBlock,
+    ReferenceFlags,
     RequirementBlock,
     SectionBlock,
     SpecBlock,
@@ -18,6 +19,7 @@ __all__ = [
     "BlockType",
     "DocumentBlock",
     "ListItemBlock",
+    "ReferenceFlags",
     "RequirementBlock",
     "SectionBlock",
     "SpecBlock",
@@ -12,12 +12,19 @@ from typing import TYPE_CHECKING, Any
 
 from wassden.language_types import Language
 
+from .id_extractor import IDExtractor
+
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from .section_patterns import SectionType
 
 # Constants for string representation
 _TEXT_PREVIEW_LENGTH = 50
 
+# Level 2 headings (##) are the top-level sections reported as found sections
+_TOP_SECTION_LEVEL = 2
+
 
 class BlockType(Enum):
     """Types of spec blocks."""
@@ -31,6 +38,45 @@ class BlockType(Enum):
     HEADING = "heading"
 
 
+@dataclass(frozen=True)
+class ReferenceFlags:
+    """Document-level reference summary consulted by traceability rules.
+
+    Attributes:
+        has_req_ids: Whether any requirement block carries a REQ- ID
+        has_task_req_refs: Whether any task block references a requirement
+        has_task_design_refs: Whether any task block references a design component
+    """
+
+    has_req_ids: bool = False
+    has_task_req_refs: bool = False
+    has_task_design_refs: bool = False
+
+    @classmethod
+    def from_blocks(cls, blocks: Iterable[SpecBlock]) -> ReferenceFlags:
+        """Compute flags in a single pass over blocks.
+
+        Args:
+            blocks: Blocks to summarize
+
+        Returns:
+            Reference flags for the given blocks
+        """
+        has_req_ids = has_task_req_refs = has_task_design_refs = False
+        for block in blocks:
+            if isinstance(block, RequirementBlock):
+                if block.req_id is not None and block.req_id.startswith("REQ-"):
+                    has_req_ids = True
+            elif isinstance(block, TaskBlock):
+                has_task_req_refs = has_task_req_refs or bool(block.req_refs)
+                has_task_design_refs = has_task_design_refs or bool(block.design_refs)
+        return cls(
+            has_req_ids=has_req_ids,
+            has_task_req_refs=has_task_req_refs,
+            has_task_design_refs=has_task_design_refs,
+        )
+
+
 @dataclass
 class SpecBlock(ABC):
     """Base class for all spec document blocks.
@@ -41,7 +87,7 @@ class SpecBlock(ABC):
         line_end: Ending line number in source document (1-indexed)
         raw_content: Raw markdown content of this block
         parent: Parent block in the tree (None for root)
-        children: Child blocks
+        children: Child blocks (add them with add_child(), see DocumentBlock)
         metadata: Additional metadata for this block
     """
 
@@ -57,6 +103,12 @@ class SpecBlock(ABC):
         """Add a child block and set its parent reference."""
         child.parent = self
         self.children.append(child)
+        self._subtree_changed()
+
+    def _subtree_changed(self) -> None:
+        """Notify ancestors that a block was added somewhere below them."""
+        if self.parent is not None:
+            self.parent._subtree_changed()
 
     def get_context_path(self) -> list[str]:
         """Get path from root to this block.
@@ -109,6 +161,12 @@ class SpecBlock(ABC):
 class DocumentBlock(SpecBlock):
     """Root document block.
 
+    The document caches views of its tree (get_blocks_by_type, reference_flags,
+    top_section_titles, section_types) on first use. The caches are reset only when
+    add_child() attaches a block anywhere below the document. Appending to children
+    directly or changing fields of existing blocks is only seen by views not computed
+    yet, so build and extend the tree with add_child().
+
     Attributes:
         title: Document title
         language: Document language
@@ -117,6 +175,83 @@ class DocumentBlock(SpecBlock):
     title: str = ""
     language: Language = Language.JAPANESE
     block_type: BlockType = field(init=False, default=BlockType.DOCUMENT)
+    _top_section_titles: list[str] | None = field(init=False, default=None, repr=False, compare=False)
+    _section_types: frozenset[SectionType | None] | None = field(init=False, default=None, repr=False, compare=False)
+    _reference_flags: ReferenceFlags | None = field(init=False, default=None, repr=False, compare=False)
+    _blocks_by_type: dict[BlockType, list[SpecBlock]] | None = field(
+        init=False, default=None, repr=False, compare=False
+    )
+
+    def _subtree_changed(self) -> None:
+        """Invalidate cached views when a block is added anywhere in the document."""
+        self._top_section_titles = None
+        self._section_types = None
+        self._reference_flags = None
+        self._blocks_by_type = None
+
+    def get_blocks_by_type(self, block_type: BlockType) -> list[SpecBlock]:
+        """Get all descendant blocks of a specific type.
+
+        Every type is indexed from a single walk of the tree on first use, so rules
+        asking for different block types share one traversal. The index is reset
+        whenever add_child() attaches a block anywhere in the document.
+
+        Args:
+            block_type: Type of blocks to find
+
+        Returns:
+            List of blocks matching the type
+        """
+        if self._blocks_by_type is None:
+            index: dict[BlockType, list[SpecBlock]] = {}
+            for block in self.get_all_descendants():
+                index.setdefault(block.block_type, []).append(block)
+            self._blocks_by_type = index
+        return list(self._blocks_by_type.get(block_type, ()))
+
+    @property
+    def reference_flags(self) -> ReferenceFlags:
+        """Reference summary for this document.
+
+        Stamped by the parser once the tree is built; computed from the
+        descendants on first access otherwise. Reset when a block is added.
+        """
+        if self._reference_flags is None:
+            self._reference_flags = ReferenceFlags.from_blocks(self.get_all_descendants())
+        return self._reference_flags
+
+    def set_reference_flags(self, flags: ReferenceFlags) -> None:
+        """Store a precomputed reference summary for this document."""
+        self._reference_flags = flags
+
+    @property
+    def top_section_titles(self) -> list[str]:
+        """Titles of level 2 (##) sections, computed on first access and cached.
+
+        The cache is reset when a block is added; callers must not mutate the returned list.
+        """
+        if self._top_section_titles is None:
+            self._top_section_titles, self._section_types = self._index_sections()
+        return self._top_section_titles
+
+    @property
+    def section_types(self) -> frozenset[SectionType | None]:
+        """Section types present anywhere in the document, cached like top_section_titles."""
+        if self._section_types is None:
+            self._top_section_titles, self._section_types = self._index_sections()
+        return self._section_types
+
+    def _index_sections(self) -> tuple[list[str], frozenset[SectionType | None]]:
+        """Collect top-level titles and section types in a single walk over the section blocks."""
+        titles: list[str] = []
+        types: set[SectionType | None] = set()
+        for block in self.get_blocks_by_type(BlockType.SECTION):
+            if not isinstance(block, SectionBlock):
+                continue
+            types.add(block.section_type)
+            if block.title and block.level == _TOP_SECTION_LEVEL:
+                titles.append(block.title)
+        return titles, frozenset(types)
 
     def __str__(self) -> str:
         """String representation of the document block."""
@@ -142,6 +277,35 @@ class SectionBlock(SpecBlock):
     section_type: SectionType | None = None
     block_type: BlockType = field(init=False, default=BlockType.SECTION)
 
+    _title_ids: tuple[str, str | None, str | None] | None = field(init=False, default=None, repr=False, compare=False)
+
+    @property
+    def title_req_id(self) -> str | None:
+        """Requirement ID found in the title.
+
+        Headings with an ID are parsed into RequirementBlocks, so this is only set on
+        sections built by hand.
+        """
+        return self._get_title_ids()[0]
+
+    @property
+    def title_task_id(self) -> str | None:
+        """Task ID found in the title; like title_req_id, only set on hand-built sections."""
+        return self._get_title_ids()[1]
+
+    def set_title_ids(self, req_id: str | None, task_id: str | None) -> None:
+        """Store the title ID lookups already done by the parser for the current title."""
+        self._title_ids = (self.title, req_id, task_id)
+
+    def _get_title_ids(self) -> tuple[str | None, str | None]:
+        """Look up the title IDs once per title; the cache is reset when the title changes."""
+        title_ids = self._title_ids
+        if title_ids is None or title_ids[0] != self.title:
+            req_id, _, _ = IDExtractor.extract_req_id_from_text(self.title)
+            task_id, _ = IDExtractor.extract_task_id_from_text(self.title)
+            title_ids = self._title_ids = (self.title, req_id, task_id)
+        return title_ids[1], title_ids[2]
+
     def __str__(self) -> str:
         """String representation of the section block."""
         section_id = f"{self.section_number}. " if self.section_number else ""
@@ -4,9 +4,10 @@ This module contains rules that validate ID formats, naming conventions,
 and other formatting requirements.
 """
 
-import re
+from collections import Counter
 
 from wassden.language_types import Language
+from wassden.lib.validation_common import validate_req_id, validate_task_id
 
 from .blocks import BlockType, DocumentBlock, RequirementBlock, TaskBlock
 from .validation_rules import (
@@ -21,8 +22,6 @@ from .validation_rules import (
 class RequirementIDFormatRule(FormatValidationRule):
     """Validates requirement ID formats."""
 
-    REQ_ID_PATTERN = re.compile(r"^REQ-\d{2}$")
-
     def __init__(self, language: Language = Language.JAPANESE) -> None:
         """Initialize requirement ID format rule."""
         super().__init__(language)
@@ -98,19 +97,12 @@ class RequirementIDFormatRule(FormatValidationRule):
         Returns:
             True if valid, False otherwise
         """
-        if not self.REQ_ID_PATTERN.match(req_id):
-            return False
-
-        # Check that number part is not 00
-        num_part = req_id.split("-")[1]
-        return num_part != "00"
+        return validate_req_id(req_id)
 
 
 class TaskIDFormatRule(FormatValidationRule):
     """Validates task ID formats."""
 
-    TASK_ID_PATTERN = re.compile(r"^TASK-\d{2}(-\d{2}){1,2}$")
-
     def __init__(self, language: Language = Language.JAPANESE) -> None:
         """Initialize task ID format rule."""
         super().__init__(language)
@@ -169,12 +161,7 @@ class TaskIDFormatRule(FormatValidationRule):
         Returns:
             True if valid, False otherwise
         """
-        if not self.TASK_ID_PATTERN.match(task_id):
-            return False
-
-        # Check that no number parts are 00
-        parts = task_id.split("-")[1:]  # Remove "TASK" part
-        return all(part != "00" for part in parts)
+        return validate_task_id(task_id)
 
 
 class DuplicateRequirementIDRule(FormatValidationRule):
@@ -212,30 +199,31 @@ class DuplicateRequirementIDRule(FormatValidationRule):
         errors: list[ValidationError] = []
 
         # Get all requirement blocks with IDs
-        req_blocks = document.get_blocks_by_type(BlockType.REQUIREMENT)
-        req_id_locations: dict[str, list[RequirementBlock]] = {}
-
+        req_blocks = [
+            block
+            for block in document.get_blocks_by_type(BlockType.REQUIREMENT)
+            if isinstance(block, RequirementBlock) and block.req_id
+        ]
+
+        # Count IDs in one pass; only duplicated IDs get their blocks grouped
+        req_id_locations: dict[str | None, list[RequirementBlock]] = {
+            req_id: [] for req_id, count in Counter(block.req_id for block in req_blocks).items() if count > 1
+        }
+        if not req_id_locations:
+            return self._create_result(errors)
         for block in req_blocks:
-            if not isinstance(block, RequirementBlock):
-                continue
+            if block.req_id in req_id_locations:
+                req_id_locations[block.req_id].append(block)
 
-            req_id = block.req_id
-            if req_id:
-                if req_id not in req_id_locations:
-                    req_id_locations[req_id] = []
-                req_id_locations[req_id].append(block)
-
-        # Find duplicates
+        # Report all occurrences of each duplicate
         for req_id, blocks in req_id_locations.items():
-            if len(blocks) > 1:
-                # Report all occurrences
-                errors.extend(
-                    ValidationError(
-                        message=f"Duplicate REQ-ID found: {req_id}",
-                        location=BlockLocation.from_block(block),
-                    )
-                    for block in blocks
+            errors.extend(
+                ValidationError(
+                    message=f"Duplicate REQ-ID found: {req_id}",
+                    location=BlockLocation.from_block(block),
                 )
+                for block in blocks
+            )
 
         return self._create_result(errors)
 
@@ -275,29 +263,30 @@ class DuplicateTaskIDRule(FormatValidationRule):
         errors: list[ValidationError] = []
 
         # Get all task blocks with IDs
-        task_blocks = document.get_blocks_by_type(BlockType.TASK)
-        task_id_locations: dict[str, list[TaskBlock]] = {}
-
+        task_blocks = [
+            block
+            for block in document.get_blocks_by_type(BlockType.TASK)
+            if isinstance(block, TaskBlock) and block.task_id
+        ]
+
+        # Count IDs in one pass; only duplicated IDs get their blocks grouped
+        task_id_locations: dict[str | None, list[TaskBlock]] = {
+            task_id: [] for task_id, count in Counter(block.task_id for block in task_blocks).items() if count > 1
+        }
+        if not task_id_locations:
+            return self._create_result(errors)
         for block in task_blocks:
-            if not isinstance(block, TaskBlock):
-                continue
+            if block.task_id in task_id_locations:
+                task_id_locations[block.task_id].append(block)
 
-            task_id = block.task_id
-            if task_id:
-                if task_id not in task_id_locations:
-                    task_id_locations[task_id] = []
-                task_id_locations[task_id].append(block)
-
-        # Find duplicates
+        # Report all occurrences of each duplicate
         for task_id, blocks in task_id_locations.items():
-            if len(blocks) > 1:
-                # Report all occurrences
-                errors.extend(
-                    ValidationError(
-                        message=f"Duplicate TASK-ID found: {task_id}",
-                        location=BlockLocation.from_block(block),
-                    )
-                    for block in blocks
+            errors.extend(
+                ValidationError(
+                    message=f"Duplicate TASK-ID found: {task_id}",
+                    location=BlockLocation.from_block(block),
                 )
+                for block in blocks
+            )
 
         return self._create_result(errors)
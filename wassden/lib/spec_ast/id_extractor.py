@@ -6,6 +6,24 @@ from specification documents (requirements, tasks, design components, etc.).
 
 import re
 
+# Task dependency phrases: "depends on TASK-XX-XX", "requires TASK-XX-XX", "after TASK-XX-XX", "依存: TASK-XX-XX".
+# One alternation scans the text once; each phrase has its own group, so match.lastindex says which phrase matched.
+_TASK_DEPENDENCY_PATTERN = re.compile(
+    "|".join(
+        (
+            r"depends on (TASK-\d{2}(?:-\d{2}){0,2})",
+            r"requires (TASK-\d{2}(?:-\d{2}){0,2})",
+            r"after (TASK-\d{2}(?:-\d{2}){0,2})",
+            r"依存:\s*(TASK-\d{2}(?:-\d{2}){0,2})",  # Japanese
+        )
+    ),
+    re.IGNORECASE,
+)
+
+# REQ/NFR/KPI/TR IDs in one alternation: the families cannot overlap, so a single
+# scan finds the same IDs as one findall per family
+_REQUIREMENT_FAMILY_PATTERN = re.compile(r"\b(?:REQ|NFR|KPI|TR)-\d{2}\b")
+
 
 class IDExtractor:
     """Extractor for various ID types in spec documents."""
@@ -48,7 +66,7 @@ class IDExtractor:
         text = text.strip()
 
         # Try strict pattern first
-        match = re.match(IDExtractor.PREFIXED_REQ_PATTERN, text)
+        match = _PREFIXED_REQ_PATTERN.match(text)
         if match:
             req_id = match.group(1)
             req_text = match.group(2).strip()
@@ -56,7 +74,7 @@ class IDExtractor:
             return req_id, req_text, req_type
 
         # Try loose pattern for malformed IDs
-        match = re.match(IDExtractor.LOOSE_REQ_PATTERN, text)
+        match = _LOOSE_REQ_PATTERN.match(text)
         if match:
             req_id = match.group(1)
             req_text = match.group(2).strip()
@@ -64,7 +82,7 @@ class IDExtractor:
             return req_id, req_text, req_type
 
         # Try catch-all pattern for completely invalid IDs (e.g., INVALID-01)
-        match = re.match(IDExtractor.INVALID_REQ_PATTERN, text)
+        match = _INVALID_REQ_PATTERN.match(text)
         if match:
             req_id = match.group(1)
             req_text = match.group(2).strip()
@@ -89,14 +107,14 @@ class IDExtractor:
         text = text.strip()
 
         # Try strict pattern first
-        match = re.match(IDExtractor.PREFIXED_TASK_PATTERN, text)
+        match = _PREFIXED_TASK_PATTERN.match(text)
         if match:
             task_id = match.group(1)
             task_text = match.group(2).strip()
             return task_id, task_text
 
         # Try loose pattern for malformed IDs
-        match = re.match(IDExtractor.LOOSE_TASK_PATTERN, text)
+        match = _LOOSE_TASK_PATTERN.match(text)
         if match:
             task_id = match.group(1)
             task_text = match.group(2).strip()
@@ -115,12 +133,7 @@ class IDExtractor:
         Returns:
             Set of requirement IDs found
         """
-        ids: set[str] = set()
-        ids.update(re.findall(IDExtractor.REQ_ID_PATTERN, text))
-        ids.update(re.findall(IDExtractor.NFR_ID_PATTERN, text))
-        ids.update(re.findall(IDExtractor.KPI_ID_PATTERN, text))
-        ids.update(re.findall(IDExtractor.TR_ID_PATTERN, text))
-        return ids
+        return set(_REQUIREMENT_FAMILY_PATTERN.findall(text))
 
     @staticmethod
     def extract_all_task_ids(text: str) -> set[str]:
@@ -132,7 +145,7 @@ class IDExtractor:
         Returns:
             Set of task IDs found
         """
-        return set(re.findall(IDExtractor.TASK_ID_PATTERN, text))
+        return set(_TASK_ID_PATTERN.findall(text))
 
     @staticmethod
     def extract_all_dc_refs(text: str) -> set[str]:
@@ -144,7 +157,7 @@ class IDExtractor:
         Returns:
             Set of DC references found (e.g., {"DC-01", "DC-03"})
         """
-        return set(re.findall(IDExtractor.DC_PATTERN, text))
+        return set(_DC_PATTERN.findall(text))
 
     @staticmethod
     def extract_task_dependencies(text: str) -> list[str]:
@@ -158,21 +171,21 @@ class IDExtractor:
         Returns:
             List of task IDs this task depends on
         """
-        dependencies: list[str] = []
+        # Matches are grouped by phrase, in the order the phrases are listed
+        matches = sorted(_TASK_DEPENDENCY_PATTERN.finditer(text), key=lambda match: match.lastindex or 0)
+        return [match.group(match.lastindex or 0) for match in matches]
 
-        # Pattern: "depends on TASK-XX-XX" or "requires TASK-XX-XX"
-        dependency_patterns = [
-            r"depends on (TASK-\d{2}(?:-\d{2}){0,2})",
-            r"requires (TASK-\d{2}(?:-\d{2}){0,2})",
-            r"after (TASK-\d{2}(?:-\d{2}){0,2})",
-            r"依存:\s*(TASK-\d{2}(?:-\d{2}){0,2})",  # Japanese
-        ]
+    @staticmethod
+    def count_task_dependencies(text: str) -> int:
+        """Count task dependencies in task text without building the ID list.
 
-        for pattern in dependency_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            dependencies.extend(matches)
+        Args:
+            text: Task description text
 
-        return dependencies
+        Returns:
+            Number of dependencies extract_task_dependencies would return
+        """
+        return sum(1 for _ in _TASK_DEPENDENCY_PATTERN.finditer(text))
 
     @staticmethod
     def is_acceptance_criteria(text: str) -> bool:
@@ -184,12 +197,19 @@ class IDExtractor:
         Returns:
             True if text looks like acceptance criteria
         """
-        skip_patterns = [
-            r"受け入れ観点",
-            r"受入観点",
-            r"Acceptance criteria",
-            r"テスト観点",
-            r"Test criteria",
-        ]
-
-        return any(re.search(pattern, text, re.IGNORECASE) for pattern in skip_patterns)
+        return _ACCEPTANCE_CRITERIA_PATTERN.search(text) is not None
+
+
+# Compiled once at import; the string attributes above stay as the public pattern definitions
+_PREFIXED_REQ_PATTERN = re.compile(IDExtractor.PREFIXED_REQ_PATTERN)
+_PREFIXED_TASK_PATTERN = re.compile(IDExtractor.PREFIXED_TASK_PATTERN)
+_LOOSE_REQ_PATTERN = re.compile(IDExtractor.LOOSE_REQ_PATTERN)
+_LOOSE_TASK_PATTERN = re.compile(IDExtractor.LOOSE_TASK_PATTERN)
+_INVALID_REQ_PATTERN = re.compile(IDExtractor.INVALID_REQ_PATTERN)
+_TASK_ID_PATTERN = re.compile(IDExtractor.TASK_ID_PATTERN)
+_DC_PATTERN = re.compile(IDExtractor.DC_PATTERN)
+
+# Phrases marking acceptance/test criteria rather than requirements
+_ACCEPTANCE_CRITERIA_PATTERN = re.compile(
+    r"受け入れ観点|受入観点|Acceptance criteria|テスト観点|Test criteria", re.IGNORECASE
+)
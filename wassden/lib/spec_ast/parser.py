@@ -10,8 +10,10 @@ from wassden.lib.spec_ast.blocks import (
     BlockType,
     DocumentBlock,
     ListItemBlock,
+    ReferenceFlags,
     RequirementBlock,
     SectionBlock,
+    SpecBlock,
     TaskBlock,
 )
 from wassden.lib.spec_ast.id_extractor import IDExtractor
@@ -20,6 +22,30 @@ from wassden.lib.spec_ast.section_patterns import SectionType, classify_section,
 # Constants
 _LINE_SEARCH_LENGTH = 30
 
+# DC field of a task: everything after "DC:" until end of line or list item
+_DC_FIELD_PATTERN = re.compile(r"DC:\s*(.+?)(?:\n|$)", re.IGNORECASE)
+# Kebab-case and snake_case identifiers inside the DC field
+_DC_COMPONENT_PATTERN = re.compile(r"([a-z][a-z0-9]*(?:[-_][a-z0-9]+)+)")
+# Section number prefix of a heading: "1. Title" or "1 Title" or "6.1 Title"
+_SECTION_NUMBER_PATTERN = re.compile(r"^(\d+(?:\.\d+)*)[.\s]+(.+)$")
+# Dependencies section lines: "TASK-01-02 依存: TASK-01-01, TASK-01-03"
+_DEPENDENCY_LINE_PATTERN = re.compile(
+    r"(TASK-[A-Z0-9-]+)\s*(?:依存|depends on|→):\s*((?:TASK-[A-Z0-9-]+(?:,\s*)?)+)", re.IGNORECASE
+)
+_DEPENDENCY_TASK_PATTERN = re.compile(r"TASK-[A-Z0-9-]+")
+
+
+def _extract_dc_components(task_text: str) -> list[str]:
+    """Extract component-style references from a task's DC field.
+
+    Matches ``DC: **input-handler**``, ``DC: input-handler, test-input-processing`` and similar.
+    The component pattern scans the field in place rather than a copied substring.
+    """
+    dc_match = _DC_FIELD_PATTERN.search(task_text)
+    if not dc_match:
+        return []
+    return _DC_COMPONENT_PATTERN.findall(task_text, dc_match.start(1), dc_match.end(1))
+
 
 class SpecMarkdownParser:
     """AST-based markdown parser for spec documents.
@@ -60,6 +86,8 @@ class SpecMarkdownParser:
 
         # Track current section for list items
         current_section: SectionBlock | None = None
+        # Blocks created below, summarized into the document's reference flags
+        parsed_blocks: list[SpecBlock] = []
 
         # Process tokens and build tree
         for token in tokens:
@@ -70,6 +98,7 @@ class SpecMarkdownParser:
                     block = self._parse_heading(token, lines)
                     if block:
                         doc.add_child(block)
+                        parsed_blocks.append(block)
                         # Only update current_section if it's actually a SectionBlock
                         if isinstance(block, SectionBlock):
                             current_section = block
@@ -79,6 +108,7 @@ class SpecMarkdownParser:
                     list_items = self._parse_list(token, lines, current_section)
                     for item in list_items:
                         current_section.add_child(item)
+                    parsed_blocks.extend(list_items)
 
                 elif token_type == "paragraph" and current_section:
                     # Extract paragraph text and add to section
@@ -92,6 +122,9 @@ class SpecMarkdownParser:
         # Post-process: Extract dependencies from Dependencies section
         self._process_dependencies_section(doc)
 
+        # Stamp reference flags from the blocks visited above so rules don't re-walk the tree
+        doc.set_reference_flags(ReferenceFlags.from_blocks(parsed_blocks))
+
         return doc
 
     def _parse_heading(
@@ -163,8 +196,8 @@ class SpecMarkdownParser:
         section_type = classify_section(clean_title, self.language.value)
         normalized_title = section_type.value
 
-        # Create section block
-        return SectionBlock(
+        # Create section block, keeping the title ID lookups done above
+        section = SectionBlock(
             line_start=line_num,
             line_end=line_num,
             raw_content=heading_text,
@@ -174,6 +207,8 @@ class SpecMarkdownParser:
             normalized_title=normalized_title,
             section_type=section_type,
         )
+        section.set_title_ids(req_id, task_id)
+        return section
 
     def _parse_list(
         self, token: dict[str, Any], lines: list[str], parent_section: SectionBlock
@@ -229,26 +264,15 @@ class SpecMarkdownParser:
 
                 elif potential_task_id:
                     # Found a task ID, treat as TaskBlock even if section type is unknown
-                    # This section contains tasks
-                    task_id, task_text = IDExtractor.extract_task_id_from_text(item_text)
+                    # This section contains tasks; the ID lookup above already split off the task text
+                    task_id, task_text = potential_task_id, potential_task_text
 
                     # Extract references and dependencies
                     req_refs = list(IDExtractor.extract_all_req_ids(task_text))
 
-                    # Extract design component references (DC-XX format)
-                    design_refs = list(IDExtractor.extract_all_dc_refs(task_text))
-
-                    # Also extract component-style and test scenario references from DC field
-                    # Pattern: look for components after "DC:"
-                    # Matches: DC: **input-handler**, DC: input-handler, test-input-processing, etc.
-                    # Extract everything after "DC:" until end of line or list item
-                    dc_match = re.search(r"DC:\s*(.+?)(?:\n|$)", task_text, re.IGNORECASE)
-                    if dc_match:
-                        dc_content = dc_match.group(1)
-                        # Extract kebab-case and snake_case identifiers from DC content
-                        component_pattern = r"([a-z][a-z0-9]*(?:[-_][a-z0-9]+)+)"
-                        components = re.findall(component_pattern, dc_content)
-                        design_refs.extend(components)
+                    # Extract design component references (DC-XX format), then component-style and
+                    # test scenario references from the DC field
+                    design_refs = [*IDExtractor.extract_all_dc_refs(task_text), *_extract_dc_components(task_text)]
 
                     dependencies = IDExtractor.extract_task_dependencies(task_text)
 
@@ -272,18 +296,9 @@ class SpecMarkdownParser:
                     # Extract references and dependencies
                     req_refs = list(IDExtractor.extract_all_req_ids(task_text))
 
-                    # Extract design component references (DC-XX format)
-                    design_refs = list(IDExtractor.extract_all_dc_refs(task_text))
-
-                    # Also extract component-style and test scenario references from DC field
-                    # Pattern: look for components after "DC:"
-                    dc_match = re.search(r"DC:\s*(.+?)(?:\n|$)", task_text, re.IGNORECASE)
-                    if dc_match:
-                        dc_content = dc_match.group(1)
-                        # Extract kebab-case and snake_case identifiers from DC content
-                        component_pattern = r"([a-z][a-z0-9]*(?:[-_][a-z0-9]+)+)"
-                        components = re.findall(component_pattern, dc_content)
-                        design_refs.extend(components)
+                    # Extract design component references (DC-XX format), then component-style and
+                    # test scenario references from the DC field
+                    design_refs = [*IDExtractor.extract_all_dc_refs(task_text), *_extract_dc_components(task_text)]
 
                     dependencies = IDExtractor.extract_task_dependencies(task_text)
 
@@ -383,9 +398,7 @@ class SpecMarkdownParser:
         Returns:
             Tuple of (section_number, clean_title)
         """
-        # Pattern: "1. Title" or "1 Title" or "6.1 Title"
-        pattern = r"^(\d+(?:\.\d+)*)[.\s]+(.+)$"
-        match = re.match(pattern, heading_text.strip())
+        match = _SECTION_NUMBER_PATTERN.match(heading_text.strip())
 
         if match:
             section_number = match.group(1)
@@ -430,14 +443,13 @@ class SpecMarkdownParser:
                 content += "\n" + (child.content or "")
 
         # Parse dependency lines
-        dep_pattern = r"(TASK-[A-Z0-9-]+)\s*(?:依存|depends on|→):\s*((?:TASK-[A-Z0-9-]+(?:,\s*)?)+)"
-        matches = re.finditer(dep_pattern, content, re.IGNORECASE)
+        matches = _DEPENDENCY_LINE_PATTERN.finditer(content)
 
         for match in matches:
             task_id = match.group(1)
             deps_str = match.group(2)
             # Split by comma for multiple dependencies
-            deps = [d.strip() for d in re.findall(r"TASK-[A-Z0-9-]+", deps_str)]
+            deps = [d.strip() for d in _DEPENDENCY_TASK_PATTERN.findall(deps_str)]
             if task_id not in task_deps:
                 task_deps[task_id] = []
             task_deps[task_id].extend(deps)
@@ -8,6 +8,12 @@ Each section pattern is defined as an individual class inheriting from BaseSecti
 import re
 from abc import ABC, abstractmethod
 from enum import Enum
+from functools import lru_cache
+
+# Leading section number of a heading title (e.g., "1. ", "1.1 ", "10. ")
+_SECTION_NUMBER_PREFIX_PATTERN = re.compile(r"^\d+\.?\s*")
+# Distinct heading titles seen across documents are few, so classifications are memoized
+_CLASSIFY_CACHE_SIZE = 1024
 
 
 class SectionType(Enum):
@@ -521,6 +527,26 @@ SECTION_PATTERNS: list[BaseSectionPattern] = [
 ]
 
 
+def _build_section_needles(language: str) -> tuple[tuple[str, SectionType], ...]:
+    """Flatten SECTION_PATTERNS into (title fragment, section type) pairs for a language.
+
+    Fragments keep SECTION_PATTERNS priority order; English fragments are lowercased
+    for the case-insensitive match.
+    """
+    if language == "ja":
+        return tuple((text, pattern.section_type) for pattern in SECTION_PATTERNS for text in pattern.ja_patterns)
+    if language == "en":
+        return tuple(
+            (text.lower(), pattern.section_type) for pattern in SECTION_PATTERNS for text in pattern.en_patterns
+        )
+    return tuple((text, pattern.section_type) for pattern in SECTION_PATTERNS for text in pattern.en_patterns)
+
+
+# Title fragments are built once per language instead of re-reading every pattern per heading
+_SECTION_NEEDLES = {language: _build_section_needles(language) for language in ("ja", "en")}
+
+
+@lru_cache(maxsize=_CLASSIFY_CACHE_SIZE)
 def classify_section(title: str, language: str = "ja") -> SectionType:
     """Classify a section title into a normalized section type.
 
@@ -535,19 +561,15 @@ def classify_section(title: str, language: str = "ja") -> SectionType:
     clean_title = title.strip()
 
     # Remove leading numbers and dots (e.g., "1. ", "1.1 ", "10. ")
-    clean_title = re.sub(r"^\d+\.?\s*", "", clean_title)
-
-    # Try to match against patterns (case-insensitive for English)
-    clean_title_lower = clean_title.lower()
-    for pattern in SECTION_PATTERNS:
-        patterns = pattern.ja_patterns if language == "ja" else pattern.en_patterns
-        for pattern_text in patterns:
-            # Case-insensitive match for English, case-sensitive for Japanese
-            if language == "en":
-                if pattern_text.lower() in clean_title_lower:
-                    return pattern.section_type
-            elif pattern_text in clean_title:
-                return pattern.section_type
+    clean_title = _SECTION_NUMBER_PREFIX_PATTERN.sub("", clean_title)
+
+    # Case-insensitive match for English, case-sensitive for Japanese
+    if language == "en":
+        clean_title = clean_title.lower()
+    needles = _SECTION_NEEDLES.get(language) or _build_section_needles(language)
+    for needle, section_type in needles:
+        if needle in clean_title:
+            return section_type
 
     return SectionType.UNKNOWN
 
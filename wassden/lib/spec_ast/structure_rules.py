@@ -4,9 +4,11 @@ This module contains rules that validate the structure and organization
 of spec documents, including required sections.
 """
 
+from collections.abc import Sequence
+
 from wassden.language_types import Language
 
-from .blocks import BlockType, DocumentBlock, SectionBlock
+from .blocks import DocumentBlock
 from .section_patterns import SectionType, get_section_pattern
 from .validation_rules import (
     BlockLocation,
@@ -16,15 +18,42 @@ from .validation_rules import (
     ValidationResult,
 )
 
+# Required section types per document kind
+_REQUIREMENTS_SECTIONS = (
+    SectionType.OVERVIEW,  # 概要/サマリー
+    SectionType.GLOSSARY,
+    SectionType.SCOPE,
+    SectionType.CONSTRAINTS,
+    SectionType.NON_FUNCTIONAL_REQUIREMENTS,  # 非機能要件
+    SectionType.KPI,
+    SectionType.FUNCTIONAL_REQUIREMENTS,
+    SectionType.TESTING_REQUIREMENTS,
+)
+_DESIGN_SECTIONS = (
+    SectionType.ARCHITECTURE,
+    SectionType.COMPONENT_DESIGN,
+    SectionType.DATA,
+    SectionType.API,
+    SectionType.NON_FUNCTIONAL,
+    SectionType.TEST,
+    SectionType.TRACEABILITY,
+)
+_TASKS_SECTIONS = (
+    SectionType.OVERVIEW,
+    SectionType.TASK_LIST,
+    SectionType.DEPENDENCIES,
+    SectionType.MILESTONES,
+)
+
 
 class RequiredSectionsRule(StructureValidationRule):
     """Base class for required sections validation."""
 
-    def __init__(self, required_section_types: list[SectionType], language: Language = Language.JAPANESE) -> None:
+    def __init__(self, required_section_types: Sequence[SectionType], language: Language = Language.JAPANESE) -> None:
         """Initialize rule with required section types.
 
         Args:
-            required_section_types: List of required section types
+            required_section_types: Required section types, in reporting order
             language: Language for validation messages
         """
         super().__init__(language)
@@ -42,9 +71,8 @@ class RequiredSectionsRule(StructureValidationRule):
         """
         errors: list[ValidationError] = []
 
-        # Get all sections from document
-        section_blocks = document.get_blocks_by_type(BlockType.SECTION)
-        found_section_types = {section.section_type for section in section_blocks if isinstance(section, SectionBlock)}
+        # Section types are indexed once per document and shared with foundSections
+        found_section_types = document.section_types
 
         # Check for missing required sections
         for required_type in self.required_section_types:
@@ -88,17 +116,7 @@ class RequirementsStructureRule(RequiredSectionsRule):
 
     def __init__(self, language: Language = Language.JAPANESE) -> None:
         """Initialize requirements structure rule."""
-        required_sections = [
-            SectionType.OVERVIEW,  # 概要/サマリー
-            SectionType.GLOSSARY,
-            SectionType.SCOPE,
-            SectionType.CONSTRAINTS,
-            SectionType.NON_FUNCTIONAL_REQUIREMENTS,  # 非機能要件
-            SectionType.KPI,
-            SectionType.FUNCTIONAL_REQUIREMENTS,
-            SectionType.TESTING_REQUIREMENTS,
-        ]
-        super().__init__(required_sections, language)
+        super().__init__(_REQUIREMENTS_SECTIONS, language)
 
     @property
     def rule_id(self) -> str:
@@ -121,16 +139,7 @@ class DesignStructureRule(RequiredSectionsRule):
 
     def __init__(self, language: Language = Language.JAPANESE) -> None:
         """Initialize design structure rule."""
-        required_sections = [
-            SectionType.ARCHITECTURE,
-            SectionType.COMPONENT_DESIGN,
-            SectionType.DATA,
-            SectionType.API,
-            SectionType.NON_FUNCTIONAL,
-            SectionType.TEST,
-            SectionType.TRACEABILITY,
-        ]
-        super().__init__(required_sections, language)
+        super().__init__(_DESIGN_SECTIONS, language)
 
     @property
     def rule_id(self) -> str:
@@ -153,13 +162,7 @@ class TasksStructureRule(RequiredSectionsRule):
 
     def __init__(self, language: Language = Language.JAPANESE) -> None:
         """Initialize tasks structure rule."""
-        required_sections = [
-            SectionType.OVERVIEW,
-            SectionType.TASK_LIST,
-            SectionType.DEPENDENCIES,
-            SectionType.MILESTONES,
-        ]
-        super().__init__(required_sections, language)
+        super().__init__(_TASKS_SECTIONS, language)
 
     @property
     def rule_id(self) -> str:
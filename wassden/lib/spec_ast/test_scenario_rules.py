@@ -17,10 +17,18 @@ from .validation_rules import (
     ValidationResult,
 )
 
+# Compiled once at import; these run per list item / task block
+_TEST_SCENARIO_WORD_PATTERN = re.compile(r"\b(test-[a-z0-9]+(?:-[a-z0-9]+)*)\b")
+_TEST_SCENARIO_PATTERN = re.compile(r"(test-[a-z0-9]+(?:-[a-z0-9]+)*)")
+_BOLD_COMPONENT_PATTERN = re.compile(r"\*\*([a-z][a-z0-9]*(?:[-_][a-z0-9]+)+)\*\*")
+_PLAIN_COMPONENT_PATTERN = re.compile(r"^([a-z][a-z0-9]*(?:[-_][a-z0-9]+)+):")
+
 
 class TestScenarioCoverageRule(TraceabilityValidationRule):
     """Validates that all test scenarios from design are referenced in tasks."""
 
+    depends_on = ("STRUCT-TASKS-001",)
+
     def __init__(self, language: Language = Language.JAPANESE) -> None:
         """Initialize test scenario coverage rule."""
         super().__init__(language)
@@ -98,8 +106,7 @@ class TestScenarioCoverageRule(TraceabilityValidationRule):
                 # Also extract test scenario names from format "**test-xxx**: description" or "test-xxx: description"
                 # This handles cases where markdown bold markers are already stripped
                 # Pattern: test-xxx (kebab-case identifier starting with "test-")
-                test_pattern = r"\b(test-[a-z0-9]+(?:-[a-z0-9]+)*)\b"
-                matches = re.findall(test_pattern, block.content)
+                matches = _TEST_SCENARIO_WORD_PATTERN.findall(block.content)
                 test_scenarios.update(matches)
 
         return test_scenarios
@@ -126,8 +133,7 @@ class TestScenarioCoverageRule(TraceabilityValidationRule):
                 # Also scan raw content for test scenario references (test-xxx format)
                 # This handles cases where test scenarios are referenced in task content
                 if block.raw_content:
-                    test_pattern = r"(test-[a-z0-9]+(?:-[a-z0-9]+)*)"
-                    matches = re.findall(test_pattern, block.raw_content)
+                    matches = _TEST_SCENARIO_PATTERN.findall(block.raw_content)
                     referenced.update(matches)
 
         return referenced
@@ -136,6 +142,8 @@ class TestScenarioCoverageRule(TraceabilityValidationRule):
 class DesignComponentCoverageRule(TraceabilityValidationRule):
     """Validates that all design components are referenced in tasks."""
 
+    depends_on = ("STRUCT-DESIGN-001",)
+
     def __init__(self, language: Language = Language.JAPANESE) -> None:
         """Initialize design component coverage rule."""
         super().__init__(language)
@@ -212,14 +220,12 @@ class DesignComponentCoverageRule(TraceabilityValidationRule):
         for block in list_item_blocks:
             if isinstance(block, ListItemBlock) and block.content:
                 # Pattern 1: **component-name** (with bold markers)
-                bold_pattern = r"\*\*([a-z][a-z0-9]*(?:[-_][a-z0-9]+)+)\*\*"
-                bold_matches = re.findall(bold_pattern, block.content)
+                bold_matches = _BOLD_COMPONENT_PATTERN.findall(block.content)
                 components.update(m for m in bold_matches if not m.startswith("test-"))
 
                 # Pattern 2: component-name: (without bold, at start of line)
                 # This handles cases where markdown parser already stripped bold markers
-                plain_pattern = r"^([a-z][a-z0-9]*(?:[-_][a-z0-9]+)+):"
-                plain_matches = re.findall(plain_pattern, block.content)
+                plain_matches = _PLAIN_COMPONENT_PATTERN.findall(block.content)
                 components.update(m for m in plain_matches if not m.startswith("test-"))
 
         return components
@@ -22,10 +22,24 @@ from .validation_rules import (
 # Display limits for error messages
 MAX_DISPLAY_REQUIREMENTS = 5
 
+# Requirement ID prefixes checked with a single str.startswith(tuple) call
+_TRACEABLE_REQ_PREFIXES = ("REQ-", "TR-")
+_ALL_REQ_PREFIXES = ("REQ-", "NFR-", "KPI-", "TR-")
+
+# REQ-IDs only, so a single search answers "any REQ reference?" without collecting the other families
+_REQ_ID_PATTERN = re.compile(IDExtractor.REQ_ID_PATTERN)
+
+# Design component names, compiled once at import: "**component-name**" anywhere, or
+# "component-name:" at the start of the item. The branches cannot match at the same
+# offset, so one findall finds what a separate scan per form would.
+_COMPONENT_NAME_PATTERN = re.compile(r"\*\*([a-z][a-z0-9]*(?:[-_][a-z0-9]+)+)\*\*|^([a-z][a-z0-9]*(?:[-_][a-z0-9]+)+):")
+
 
 class RequirementCoverageRule(TraceabilityValidationRule):
     """Validates that all requirements are referenced in design or tasks."""
 
+    depends_on = ("STRUCT-DESIGN-001", "STRUCT-TASKS-001")
+
     def __init__(self, language: Language = Language.JAPANESE) -> None:
         """Initialize requirement coverage rule."""
         super().__init__(language)
@@ -105,7 +119,11 @@ class RequirementCoverageRule(TraceabilityValidationRule):
         for block in req_blocks:
             # Only REQ- and TR- require explicit traceability
             # NFR and KPI are system-wide and don't need component mapping
-            if isinstance(block, RequirementBlock) and block.req_id and block.req_id.startswith(("REQ-", "TR-")):
+            if (
+                isinstance(block, RequirementBlock)
+                and block.req_id
+                and block.req_id.startswith(_TRACEABLE_REQ_PREFIXES)
+            ):
                 req_ids.add(block.req_id)
 
         return req_ids
@@ -131,23 +149,15 @@ class RequirementCoverageRule(TraceabilityValidationRule):
         req_blocks = document.get_blocks_by_type(BlockType.REQUIREMENT)
         for block in req_blocks:
             # Include all requirement types
-            if (
-                isinstance(block, RequirementBlock)
-                and block.req_id
-                and block.req_id.startswith(("REQ-", "NFR-", "KPI-", "TR-"))
-            ):
+            if isinstance(block, RequirementBlock) and block.req_id and block.req_id.startswith(_ALL_REQ_PREFIXES):
                 referenced_ids.add(block.req_id)
 
         # Also check list item blocks (for traceability section list items)
         list_item_blocks = document.get_blocks_by_type(BlockType.LIST_ITEM)
         for block in list_item_blocks:
             if isinstance(block, ListItemBlock) and block.content:
-                # Extract all requirement IDs (REQ-, NFR-, KPI-, TR-)
-                req_ids = list(IDExtractor.extract_all_req_ids(block.content))
-                for req_id in req_ids:
-                    # Include all requirement types
-                    if req_id.startswith(("REQ-", "NFR-", "KPI-", "TR-")):
-                        referenced_ids.add(req_id)
+                # extract_all_req_ids only yields REQ-/NFR-/KPI-/TR- IDs, so no prefix filter is needed
+                referenced_ids.update(IDExtractor.extract_all_req_ids(block.content))
 
         return referenced_ids
 
@@ -155,6 +165,8 @@ class RequirementCoverageRule(TraceabilityValidationRule):
 class DesignReferencesRequirementsRule(TraceabilityValidationRule):
     """Validates that design document references requirements."""
 
+    depends_on = ("STRUCT-DESIGN-001",)
+
     def __init__(self, language: Language = Language.JAPANESE) -> None:
         """Initialize design references requirements rule."""
         super().__init__(language)
@@ -186,21 +198,15 @@ class DesignReferencesRequirementsRule(TraceabilityValidationRule):
         """
         errors: list[ValidationError] = []
 
-        # Find all requirement blocks (traceability section contains requirements)
-        req_blocks = document.get_blocks_by_type(BlockType.REQUIREMENT)
-
-        # Check if any REQ-IDs are found in RequirementBlocks
-        has_req_refs = any(
-            isinstance(block, RequirementBlock) and block.req_id and block.req_id.startswith("REQ-")
-            for block in req_blocks
-        )
+        # Check if any REQ-IDs are found in RequirementBlocks (traceability section contains requirements)
+        has_req_refs = document.reference_flags.has_req_ids
 
         # Also check SectionBlock titles (current parser behavior)
         if not has_req_refs:
             section_blocks = document.get_blocks_by_type(BlockType.SECTION)
             for block in section_blocks:
-                if isinstance(block, SectionBlock) and block.title:
-                    req_id, _, _ = IDExtractor.extract_req_id_from_text(block.title)
+                if isinstance(block, SectionBlock):
+                    req_id = block.title_req_id
                     if req_id and req_id.startswith("REQ-"):
                         has_req_refs = True
                         break
@@ -209,12 +215,10 @@ class DesignReferencesRequirementsRule(TraceabilityValidationRule):
         if not has_req_refs:
             list_item_blocks = document.get_blocks_by_type(BlockType.LIST_ITEM)
             for block in list_item_blocks:
-                if isinstance(block, ListItemBlock) and block.content:
-                    # Use extract_all_req_ids for traceability items like "REQ-01 ⇔ component-a"
-                    req_ids = list(IDExtractor.extract_all_req_ids(block.content))
-                    if any(req_id.startswith("REQ-") for req_id in req_ids):
-                        has_req_refs = True
-                        break
+                # Traceability items look like "REQ-01 ⇔ component-a"
+                if isinstance(block, ListItemBlock) and block.content and _REQ_ID_PATTERN.search(block.content):
+                    has_req_refs = True
+                    break
 
         if not has_req_refs:
             errors.append(
@@ -230,6 +234,8 @@ class DesignReferencesRequirementsRule(TraceabilityValidationRule):
 class TasksReferenceRequirementsRule(TraceabilityValidationRule):
     """Validates that tasks document references requirements."""
 
+    depends_on = ("STRUCT-TASKS-001",)
+
     def __init__(self, language: Language = Language.JAPANESE) -> None:
         """Initialize tasks reference requirements rule."""
         super().__init__(language)
@@ -266,15 +272,10 @@ class TasksReferenceRequirementsRule(TraceabilityValidationRule):
             return self._create_result(errors)
 
         # Check if tasks have any requirement references
-        task_blocks = document.get_blocks_by_type(BlockType.TASK)
-        has_req_refs = any(isinstance(block, TaskBlock) and block.req_refs for block in task_blocks)
+        has_req_refs = document.reference_flags.has_task_req_refs
 
-        # Extract all requirements from requirements document
-        req_blocks = context.requirements_doc.get_blocks_by_type(BlockType.REQUIREMENT)
-        has_requirements = any(
-            isinstance(block, RequirementBlock) and block.req_id and block.req_id.startswith("REQ-")
-            for block in req_blocks
-        )
+        # Check if the requirements document defines any REQ-IDs
+        has_requirements = context.requirements_doc.reference_flags.has_req_ids
 
         # If requirements exist but tasks don't reference them, error
         if has_requirements and not has_req_refs:
@@ -291,6 +292,8 @@ class TasksReferenceRequirementsRule(TraceabilityValidationRule):
 class TasksReferenceDesignRule(TraceabilityValidationRule):
     """Validates that tasks document references design components."""
 
+    depends_on = ("STRUCT-TASKS-001",)
+
     def __init__(self, language: Language = Language.JAPANESE) -> None:
         """Initialize tasks reference design rule."""
         super().__init__(language)
@@ -326,11 +329,8 @@ class TasksReferenceDesignRule(TraceabilityValidationRule):
         if not context.design_doc:
             return self._create_result(errors)
 
-        # Check if tasks have any design references
-        task_blocks = document.get_blocks_by_type(BlockType.TASK)
-
-        # Check design_refs field
-        has_design_refs_field = any(isinstance(block, TaskBlock) and block.design_refs for block in task_blocks)
+        # Check if tasks have any design references (design_refs field)
+        has_design_refs_field = document.reference_flags.has_task_design_refs
 
         # Also check if design components appear in task content (legacy compatibility)
         has_design_refs_content = False
@@ -340,17 +340,12 @@ class TasksReferenceDesignRule(TraceabilityValidationRule):
             list_item_blocks = context.design_doc.get_blocks_by_type(BlockType.LIST_ITEM)
             for block in list_item_blocks:
                 if isinstance(block, ListItemBlock) and block.content:
-                    # Pattern 1: **component-name** (with bold markers)
-                    bold_pattern = r"\*\*([a-z][a-z0-9]*(?:[-_][a-z0-9]+)+)\*\*"
-                    bold_matches = re.findall(bold_pattern, block.content)
-                    design_components.update(bold_matches)
-
-                    # Pattern 2: component-name: (without bold, at start of line)
-                    plain_pattern = r"^([a-z][a-z0-9]*(?:[-_][a-z0-9]+)+):"
-                    plain_matches = re.findall(plain_pattern, block.content)
-                    design_components.update(plain_matches)
+                    # Exactly one group is set per match: bold or plain component name
+                    for bold_name, plain_name in _COMPONENT_NAME_PATTERN.findall(block.content):
+                        design_components.add(bold_name or plain_name)
 
             # Check if any component appears in task content
+            task_blocks = document.get_blocks_by_type(BlockType.TASK)
             for task_block in task_blocks:
                 if isinstance(task_block, TaskBlock):
                     content = task_block.raw_content or task_block.task_text or ""
@@ -375,6 +370,8 @@ class TasksReferenceDesignRule(TraceabilityValidationRule):
 class TraceabilitySectionRule(TraceabilityValidationRule):
     """Validates that design document has traceability section."""
 
+    depends_on = ("STRUCT-DESIGN-001",)
+
     def __init__(self, language: Language = Language.JAPANESE) -> None:
         """Initialize traceability section rule."""
         super().__init__(language)
@@ -406,13 +403,8 @@ class TraceabilitySectionRule(TraceabilityValidationRule):
         """
         errors: list[ValidationError] = []
 
-        # Check for traceability section
-        section_blocks = document.get_blocks_by_type(BlockType.SECTION)
-        has_traceability = any(
-            block.section_type == SectionType.TRACEABILITY for block in section_blocks if hasattr(block, "section_type")
-        )
-
-        if not has_traceability:
+        # Check for traceability section in the document's cached section type index
+        if SectionType.TRACEABILITY not in document.section_types:
             errors.append(
                 ValidationError(
                     message="Missing required traceability section (トレーサビリティ or Traceability)",
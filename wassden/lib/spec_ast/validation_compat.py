@@ -5,6 +5,7 @@ validation system, maintaining the existing function interfaces while using
 the new validation engine internally.
 """
 
+import functools
 import re
 from typing import Any
 
@@ -18,7 +19,77 @@ from .validation_engine import ValidationEngine
 from .validation_rules import ValidationResult
 
 # Constants
-HEADING_LEVEL_2 = 2  # Level 2 headings (##) for backward compatibility with legacy validation
+_REQ_PREFIXES = ("REQ-", "NFR-", "KPI-")  # Requirement prefixes reported separately from TR-
+
+# Single pass over each error message: the first alternative matching a message decides how it is parsed
+# (requirement ID lists, TR-only messages, or design component/test scenario lists from the tasks rules)
+_MISSING_REFS_PATTERN = re.compile(
+    r"(?:Requirements? not referenced|Missing references to requirements)[^:]*:\s*(?P<requirements>.+)"
+    r"|(?P<test_requirements>Test requirement not referenced)"
+    r"|not referenced in tasks:\s*(?P<design>.+)"
+)
+_TR_ID_PATTERN = re.compile(r"TR-\d+")
+# Parsed requirements/design documents kept for reuse as cross-reference context
+_REFERENCE_DOCUMENT_CACHE_SIZE = 8
+_COMPONENT_NAME_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789")
+_COMPONENT_NAME_MIN_PARTS = 2
+
+
+def _is_component_name(name: str) -> bool:
+    """Check for a kebab/snake-case component name such as ``auth-service`` or ``test_login``.
+
+    Equivalent to ``^[a-z][a-z0-9]*(?:[-_][a-z0-9]+)+$`` but done with plain string
+    operations, which is cheaper than a regex match for these short tokens.
+
+    Args:
+        name: Candidate component or test scenario name
+
+    Returns:
+        True if the name is lowercase ASCII, starts with a letter and has at least
+        two non-empty parts separated by ``-`` or ``_``
+    """
+    if not name or not "a" <= name[0] <= "z":
+        return False
+    parts = name.replace("_", "-").split("-")
+    return len(parts) >= _COMPONENT_NAME_MIN_PARTS and all(
+        part and _COMPONENT_NAME_CHARS.issuperset(part) for part in parts
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _get_parser(language: Language) -> SpecMarkdownParser:
+    """Get the shared parser for a language (parsing keeps no state between calls)."""
+    return SpecMarkdownParser(language)
+
+
+@functools.lru_cache(maxsize=_REFERENCE_DOCUMENT_CACHE_SIZE)
+def _parse_reference_document(language: Language, content: str) -> DocumentBlock:
+    """Parse a document that only serves as cross-reference context.
+
+    The same requirements (and design) text is usually passed to validate_design and
+    then validate_tasks, so reference documents are parsed once and shared; rules only
+    read them.
+    """
+    return _get_parser(language).parse(content)
+
+
+def _parse_documents(
+    language: Language, content: str, *reference_contents: str | None
+) -> tuple[DocumentBlock, list[DocumentBlock | None]]:
+    """Parse a document and its reference documents.
+
+    Args:
+        language: Language of the documents
+        content: Content of the document being validated
+        *reference_contents: Reference document contents; empty or None entries yield None
+
+    Returns:
+        Parsed document and the parsed reference documents in the same order
+    """
+    document = _get_parser(language).parse(content)
+    return document, [
+        _parse_reference_document(language, reference) if reference else None for reference in reference_contents
+    ]
 
 
 def extract_stats_from_document(document: DocumentBlock, doc_type: str) -> dict[str, Any]:
@@ -31,13 +102,8 @@ def extract_stats_from_document(document: DocumentBlock, doc_type: str) -> dict[
     Returns:
         Dictionary with statistics
     """
-    if doc_type == "requirements":
-        return _extract_requirements_stats(document)
-    if doc_type == "design":
-        return _extract_design_stats(document)
-    if doc_type == "tasks":
-        return _extract_tasks_stats(document)
-    return {}
+    extractor = _STATS_EXTRACTORS.get(doc_type)
+    return extractor(document) if extractor else {}
 
 
 def _extract_requirements_stats(document: DocumentBlock) -> dict[str, Any]:  # noqa: C901, PLR0912
@@ -63,8 +129,8 @@ def _extract_requirements_stats(document: DocumentBlock) -> dict[str, Any]:  # n
     # Also extract from SectionBlock titles (current parser behavior)
     section_blocks = document.get_blocks_by_type(BlockType.SECTION)
     for block in section_blocks:
-        if isinstance(block, SectionBlock) and block.title:
-            req_id, _, _ = IDExtractor.extract_req_id_from_text(block.title)
+        if isinstance(block, SectionBlock):
+            req_id = block.title_req_id
             if req_id:
                 if req_id.startswith("REQ-"):
                     req_ids.add(req_id)
@@ -100,8 +166,8 @@ def _extract_design_stats(document: DocumentBlock) -> dict[str, Any]:  # noqa: C
     # Also extract from SectionBlock titles (current parser behavior)
     section_blocks = document.get_blocks_by_type(BlockType.SECTION)
     for block in section_blocks:
-        if isinstance(block, SectionBlock) and block.title:
-            req_id, _, _ = IDExtractor.extract_req_id_from_text(block.title)
+        if isinstance(block, SectionBlock):
+            req_id = block.title_req_id
             if req_id:
                 if req_id.startswith("REQ-"):
                     referenced_reqs.add(req_id)
@@ -129,29 +195,22 @@ def _extract_design_stats(document: DocumentBlock) -> dict[str, Any]:  # noqa: C
 
 def _extract_tasks_stats(document: DocumentBlock) -> dict[str, Any]:
     """Extract statistics from tasks document."""
-    task_ids = set()
-    dependencies = 0
-
     # Extract from TaskBlock objects (if parser creates them)
-    task_blocks = document.get_blocks_by_type(BlockType.TASK)
-    for block in task_blocks:
-        if isinstance(block, TaskBlock):
-            if block.task_id:
-                task_ids.add(block.task_id)
-            if block.dependencies:
-                dependencies += len(block.dependencies)
-
+    task_blocks = [block for block in document.get_blocks_by_type(BlockType.TASK) if isinstance(block, TaskBlock)]
     # Also extract from SectionBlock titles (current parser behavior)
-    section_blocks = document.get_blocks_by_type(BlockType.SECTION)
-    for block in section_blocks:
-        if isinstance(block, SectionBlock) and block.title:
-            task_id, _ = IDExtractor.extract_task_id_from_text(block.title)
-            if task_id:
-                task_ids.add(task_id)
-            # Extract dependencies from block content if available
-            if block.raw_content:
-                task_deps = IDExtractor.extract_task_dependencies(block.raw_content)
-                dependencies += len(task_deps)
+    section_blocks = [
+        block
+        for block in document.get_blocks_by_type(BlockType.SECTION)
+        if isinstance(block, SectionBlock) and block.title
+    ]
+
+    task_ids = {block.task_id for block in task_blocks if block.task_id}
+    task_ids.update(task_id for block in section_blocks if (task_id := block.title_task_id))
+
+    # Count dependencies from task attributes and section content without materialising ID lists
+    dependencies = sum(len(block.dependencies) for block in task_blocks) + sum(
+        IDExtractor.count_task_dependencies(block.raw_content) for block in section_blocks if block.raw_content
+    )
 
     return {
         "totalTasks": len(task_ids),
@@ -162,6 +221,14 @@ def _extract_tasks_stats(document: DocumentBlock) -> dict[str, Any]:
     }
 
 
+# Stats extractor per document type, looked up once per call
+_STATS_EXTRACTORS = {
+    "requirements": _extract_requirements_stats,
+    "design": _extract_design_stats,
+    "tasks": _extract_tasks_stats,
+}
+
+
 def extract_found_sections(document: DocumentBlock) -> list[str]:
     """Extract list of found section titles from document.
 
@@ -171,13 +238,9 @@ def extract_found_sections(document: DocumentBlock) -> list[str]:
     Returns:
         List of section titles found in document (level 2 headings only for backward compatibility)
     """
-    section_blocks = document.get_blocks_by_type(BlockType.SECTION)
-    # Only include level 2 sections for backward compatibility with legacy validation
-    return [
-        block.title
-        for block in section_blocks
-        if isinstance(block, SectionBlock) and block.title and block.level == HEADING_LEVEL_2
-    ]
+    # Only include level 2 sections for backward compatibility with legacy validation.
+    # Copy the document's cached view so callers can't mutate it.
+    return list(document.top_section_titles)
 
 
 def convert_validation_results_to_errors(results: list[ValidationResult]) -> list[str]:
@@ -189,11 +252,7 @@ def convert_validation_results_to_errors(results: list[ValidationResult]) -> lis
     Returns:
         List of error message strings
     """
-    errors: list[str] = []
-    for result in results:
-        if not result.is_valid:
-            errors.extend(error.message for error in result.errors)
-    return errors
+    return [error.message for result in results if not result.is_valid for error in result.errors]
 
 
 def convert_validation_results_to_dict(results: list[ValidationResult]) -> dict[str, Any]:
@@ -205,22 +264,15 @@ def convert_validation_results_to_dict(results: list[ValidationResult]) -> dict[
     Returns:
         Dictionary with validation results in legacy format
     """
-    # Collect all errors
-    all_errors: list[str] = []
-    for result in results:
-        if not result.is_valid:
-            all_errors.extend(error.message for error in result.errors)
-
-    # Determine if valid
-    is_valid = len(all_errors) == 0
+    all_errors = convert_validation_results_to_errors(results)
 
     return {
-        "isValid": is_valid,
+        "isValid": not all_errors,
         "issues": all_errors,
     }
 
 
-def extract_missing_references_from_results(results: list[ValidationResult]) -> dict[str, list[str]]:  # noqa: C901
+def extract_missing_references_from_results(results: list[ValidationResult]) -> dict[str, list[str]]:
     """Extract missing references from validation results.
 
     Args:
@@ -229,59 +281,45 @@ def extract_missing_references_from_results(results: list[ValidationResult]) ->
     Returns:
         Dictionary with missing references by type
     """
-    missing_refs: dict[str, list[str]] = {
-        "requirements": [],
-        "test_requirements": [],
-        "design": [],
+    missing_refs: dict[str, set[str]] = {
+        "requirements": set(),
+        "test_requirements": set(),
+        "design": set(),
     }
 
     for result in results:
         for error in result.errors:
             message = error.message
+            match = _MISSING_REFS_PATTERN.search(message)
+            if match is None:
+                continue
 
-            # Extract missing requirements (REQ-XX, NFR-XX, KPI-XX, TR-XX)
-            if (
-                "Requirements not referenced" in message
-                or "Requirement not referenced" in message
-                or "Missing references to requirements" in message
-            ):
+            refs_str = match.group("requirements")
+            if refs_str is not None:
                 # Parse: "Requirements not referenced: REQ-01, REQ-02, TR-01, TR-02..."
                 # or "Missing references to requirements: REQ-01, REQ-02..."
-                match = re.search(r"(?:requirements|Requirements?|REQ-\d+)[^:]*:\s*(.+)", message)
-                if match:
-                    refs_str = match.group(1).replace("...", "")
-                    refs = [r.strip() for r in refs_str.split(",") if r.strip()]
-                    # Separate REQ/NFR/KPI from TR
-                    for ref in refs:
-                        if ref.startswith(("REQ-", "NFR-", "KPI-")):
-                            missing_refs["requirements"].append(ref)
-                        elif ref.startswith("TR-"):
-                            missing_refs["test_requirements"].append(ref)
-
-            # Extract missing test requirements (TR-XX) - alternative pattern
-            elif "Test requirement not referenced" in message:
-                # Extract all TR-IDs from message
-                tr_ids = re.findall(r"TR-\d+", message)
-                missing_refs["test_requirements"].extend(tr_ids)
-
-            # Extract missing design components
-            if "not referenced in tasks:" in message:
+                # Separate REQ/NFR/KPI from TR (empty tokens match neither prefix)
+                for token in refs_str.replace("...", "").split(","):
+                    ref = token.strip()
+                    if ref.startswith(_REQ_PREFIXES):
+                        missing_refs["requirements"].add(ref)
+                    elif ref.startswith("TR-"):
+                        missing_refs["test_requirements"].add(ref)
+
+            elif match.group("test_requirements") is not None:
+                # Extract all TR-IDs from message - alternative pattern
+                missing_refs["test_requirements"].update(_TR_ID_PATTERN.findall(message))
+
+            else:
                 # Pattern: "Design components not referenced in tasks: comp1, comp2, comp3..."
                 # or "Test scenario not referenced in tasks: test-xxx"
-                list_match = re.search(r"not referenced in tasks:\s*(.+)", message)
-                if list_match:
-                    components_str = list_match.group(1).replace("...", "")
-                    # Split by comma and extract component names
-                    components = [c.strip() for c in components_str.split(",") if c.strip()]
-                    # Filter to only valid component/scenario names
-                    valid_comps = [c for c in components if re.match(r"^[a-z][a-z0-9]*(?:[-_][a-z0-9]+)+$", c)]
-                    missing_refs["design"].extend(valid_comps)
+                components_str = match.group("design").replace("...", "")
+                # Split by comma and keep only valid component/scenario names
+                components = (token.strip() for token in components_str.split(","))
+                missing_refs["design"].update(c for c in components if _is_component_name(c))
 
-    # Remove duplicates and sort
-    for key, values in missing_refs.items():
-        missing_refs[key] = sorted(set(values))
-
-    return missing_refs
+    # Sets already hold unique references; return them sorted
+    return {key: sorted(values) for key, values in missing_refs.items()}
 
 
 def validate_requirements_structure_ast(req_content: str, language: Language = Language.JAPANESE) -> list[str]:
@@ -298,7 +336,7 @@ def validate_requirements_structure_ast(req_content: str, language: Language = L
         List of error messages (empty if valid)
     """
     # Parse document
-    parser = SpecMarkdownParser(language)
+    parser = _get_parser(language)
     document = parser.parse(req_content)
 
     # Validate using AST engine
@@ -323,7 +361,7 @@ def validate_design_structure_ast(design_content: str, language: Language = Lang
         List of error messages (empty if valid)
     """
     # Parse document
-    parser = SpecMarkdownParser(language)
+    parser = _get_parser(language)
     document = parser.parse(design_content)
 
     # Validate using AST engine
@@ -348,7 +386,7 @@ def validate_tasks_structure_ast(tasks_content: str, language: Language = Langua
         List of error messages (empty if valid)
     """
     # Parse document
-    parser = SpecMarkdownParser(language)
+    parser = _get_parser(language)
     document = parser.parse(tasks_content)
 
     # Validate using AST engine
@@ -359,6 +397,29 @@ def validate_tasks_structure_ast(tasks_content: str, language: Language = Langua
     return convert_validation_results_to_errors(results)
 
 
+def _find_task_requirement_references(document: DocumentBlock) -> tuple[bool, bool]:
+    """Check in one pass over task references whether tasks reference REQ-IDs and TR-IDs.
+
+    Args:
+        document: Parsed tasks document
+
+    Returns:
+        Tuple of (references REQ-IDs, references TR-IDs)
+    """
+    references_reqs = references_trs = False
+    for block in document.get_blocks_by_type(BlockType.TASK):
+        if not isinstance(block, TaskBlock):
+            continue
+        for ref in block.req_refs:
+            if ref.startswith("REQ-"):
+                references_reqs = True
+            elif ref.startswith("TR-"):
+                references_trs = True
+        if references_reqs and references_trs:
+            break
+    return references_reqs, references_trs
+
+
 def validate_requirements_ast(content: str, language: Language | None = None) -> dict[str, Any]:
     """Validate requirements document using AST validation.
 
@@ -377,7 +438,7 @@ def validate_requirements_ast(content: str, language: Language | None = None) ->
         language = detect_language_from_spec_content(content)
 
     # Parse document
-    parser = SpecMarkdownParser(language)
+    parser = _get_parser(language)
     document = parser.parse(content)
 
     # Validate using AST engine
@@ -416,13 +477,11 @@ def validate_design_ast(
         language = detect_language_from_spec_content(content)
 
     # Parse documents
-    parser = SpecMarkdownParser(language)
-    document = parser.parse(content)
+    document, (req_document,) = _parse_documents(language, content, requirements_content)
 
     # Create engine and set context
     engine = ValidationEngine(language)
-    if requirements_content:
-        req_document = parser.parse(requirements_content)
+    if req_document is not None:
         engine.set_requirements_document(req_document)
 
     # Validate using AST engine
@@ -469,16 +528,15 @@ def validate_tasks_ast(
         language = detect_language_from_spec_content(content)
 
     # Parse documents
-    parser = SpecMarkdownParser(language)
-    document = parser.parse(content)
+    document, (req_document, design_document) = _parse_documents(
+        language, content, requirements_content, design_content
+    )
 
     # Create engine and set context
     engine = ValidationEngine(language)
-    if requirements_content:
-        req_document = parser.parse(requirements_content)
+    if req_document is not None:
         engine.set_requirements_document(req_document)
-    if design_content:
-        design_document = parser.parse(design_content)
+    if design_document is not None:
         engine.set_design_document(design_document)
 
     # Validate using AST engine
@@ -499,23 +557,18 @@ def validate_tasks_ast(
 
     # Additional validation: Check if tasks reference requirements but no requirements content exists
     # This matches legacy validation behavior
-    task_blocks = document.get_blocks_by_type(BlockType.TASK)
-    tasks_reference_reqs = any(
-        isinstance(block, TaskBlock) and block.req_refs and any(ref.startswith("REQ-") for ref in block.req_refs)
-        for block in task_blocks
-    )
-    tasks_reference_trs = any(
-        isinstance(block, TaskBlock) and block.req_refs and any(ref.startswith("TR-") for ref in block.req_refs)
-        for block in task_blocks
-    )
+    if requirements_content:
+        return result_dict
+
+    tasks_reference_reqs, tasks_reference_trs = _find_task_requirement_references(document)
 
-    if tasks_reference_reqs and not requirements_content:
+    if tasks_reference_reqs:
         result_dict["issues"].append(
             "Requirements not referenced - tasks reference REQ-IDs but requirements.md is missing"
         )
         result_dict["isValid"] = False
 
-    if tasks_reference_trs and not requirements_content:
+    if tasks_reference_trs:
         result_dict["issues"].append(
             "Test requirements not referenced - tasks reference TR-IDs but requirements.md is missing"
         )
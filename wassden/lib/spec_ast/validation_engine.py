@@ -4,6 +4,8 @@ This module provides a high-level interface for running validation rules
 on spec documents using document styles.
 """
 
+from collections.abc import Sequence
+from operator import attrgetter
 from typing import Any
 
 from wassden.language_types import Language
@@ -12,17 +14,36 @@ from .blocks import DocumentBlock
 from .document_styles import DESIGN_STYLE, REQUIREMENTS_STYLE, TASKS_STYLE, DocumentStyle, get_document_style
 from .validation_rules import ValidationContext, ValidationResult, ValidationRule
 
+# C-level accessor used to gather error messages without a Python-level generator
+_error_message = attrgetter("message")
+
+# Rules keep no per-document state, so instances are shared across calls and engines.
+# Keyed by style name and rule classes so custom styles never pick up another style's rules.
+_RULE_CACHE: dict[tuple[str, tuple[type[ValidationRule], ...], Language], tuple[ValidationRule, ...]] = {}
+
+
+def _get_rules(style: DocumentStyle, language: Language) -> tuple[ValidationRule, ...]:
+    """Get the cached rule instances for a style and language, creating them on first use."""
+    key = (style.name, tuple(style.validation_rules), language)
+    rules = _RULE_CACHE.get(key)
+    if rules is None:
+        rules = _RULE_CACHE[key] = tuple(style.create_validation_rules(language))
+    return rules
+
 
 class ValidationEngine:
     """Engine for running validation rules on spec documents."""
 
-    def __init__(self, language: Language = Language.JAPANESE) -> None:
+    def __init__(self, language: Language = Language.JAPANESE, *, fail_fast: bool = False) -> None:
         """Initialize validation engine.
 
         Args:
             language: Language for validation messages
+            fail_fast: Skip rules whose prerequisite rules (ValidationRule.depends_on)
+                failed earlier in the run, instead of reporting their cascading errors
         """
         self.language = language
+        self.fail_fast = fail_fast
         self.context = ValidationContext(language)
 
     def set_requirements_document(self, document: DocumentBlock) -> None:
@@ -58,8 +79,7 @@ class ValidationEngine:
         Returns:
             List of validation results
         """
-        self.context.document_type = "requirements"
-        return self.validate_document(document, REQUIREMENTS_STYLE)
+        return self._validate_as(document, "requirements", REQUIREMENTS_STYLE)
 
     def validate_design(self, document: DocumentBlock) -> list[ValidationResult]:
         """Validate design document using predefined design style.
@@ -70,8 +90,7 @@ class ValidationEngine:
         Returns:
             List of validation results
         """
-        self.context.document_type = "design"
-        return self.validate_document(document, DESIGN_STYLE)
+        return self._validate_as(document, "design", DESIGN_STYLE)
 
     def validate_tasks(self, document: DocumentBlock) -> list[ValidationResult]:
         """Validate tasks document using predefined tasks style.
@@ -82,8 +101,12 @@ class ValidationEngine:
         Returns:
             List of validation results
         """
-        self.context.document_type = "tasks"
-        return self.validate_document(document, TASKS_STYLE)
+        return self._validate_as(document, "tasks", TASKS_STYLE)
+
+    def _validate_as(self, document: DocumentBlock, document_type: str, style: DocumentStyle) -> list[ValidationResult]:
+        """Record the document type in the context and validate with the given style."""
+        self.context.document_type = document_type
+        return self.validate_document(document, style)
 
     def validate_with_style(self, document: DocumentBlock, style_name: str) -> list[ValidationResult]:
         """Validate document using a named document style.
@@ -114,11 +137,9 @@ class ValidationEngine:
         Returns:
             List of validation results
         """
-        # Create validation rules from style
-        rules = style.create_validation_rules(self.language)
-        return self._run_rules(document, rules)
+        return self._run_rules(document, _get_rules(style, self.language))
 
-    def _run_rules(self, document: DocumentBlock, rules: list[ValidationRule]) -> list[ValidationResult]:
+    def _run_rules(self, document: DocumentBlock, rules: Sequence[ValidationRule]) -> list[ValidationResult]:
         """Run validation rules on a document.
 
         Args:
@@ -128,36 +149,74 @@ class ValidationEngine:
         Returns:
             List of validation results
         """
+        if self.fail_fast:
+            return self._run_rules_fail_fast(document, rules)
+        return [rule.validate(document, self.context) for rule in rules]
+
+    def _run_rules_fail_fast(self, document: DocumentBlock, rules: Sequence[ValidationRule]) -> list[ValidationResult]:
+        """Run rules in order, skipping those whose prerequisite rules have failed.
+
+        Args:
+            document: Document to validate
+            rules: List of rules to apply
+
+        Returns:
+            List of validation results, with skipped=True for rules that were not run
+        """
+        failed_rule_ids: set[str] = set()
         results = []
         for rule in rules:
+            if failed_rule_ids.intersection(rule.depends_on):
+                results.append(
+                    ValidationResult(rule_id=rule.rule_id, rule_name=rule.rule_name, is_valid=True, skipped=True)
+                )
+                continue
             result = rule.validate(document, self.context)
+            if not result.is_valid:
+                failed_rule_ids.add(rule.rule_id)
             results.append(result)
         return results
 
-    def get_validation_summary(self, results: list[ValidationResult]) -> dict[str, Any]:
+    def get_validation_summary(
+        self, results: list[ValidationResult], *, include_results: bool = True
+    ) -> dict[str, Any]:
         """Get summary of validation results.
 
         Args:
             results: List of validation results
+            include_results: Whether to serialize each result under "results" (skip when
+                only the counts and error messages are consumed)
 
         Returns:
-            Dictionary with summary information
+            Dictionary with summary information; rules skipped in fail-fast mode are
+            counted in skippedRules, not in passedRules
         """
-        total_rules = len(results)
-        passed_rules = sum(1 for r in results if r.is_valid)
-        failed_rules = total_rules - passed_rules
-        total_errors = sum(len(r.errors) for r in results)
-
+        passed_rules = 0
+        skipped_rules = 0
         all_errors: list[str] = []
+        result_dicts: list[dict[str, Any]] = []
+        # Single pass: count, collect messages and serialize each result together
         for result in results:
-            all_errors.extend(error.message for error in result.errors)
+            if result.skipped:
+                skipped_rules += 1
+            else:
+                passed_rules += result.is_valid
+            all_errors.extend(map(_error_message, result.errors))
+            if include_results:
+                result_dicts.append(result.to_dict())
+
+        total_rules = len(results)
+        failed_rules = total_rules - passed_rules - skipped_rules
 
-        return {
+        summary: dict[str, Any] = {
             "isValid": failed_rules == 0,
             "totalRules": total_rules,
             "passedRules": passed_rules,
             "failedRules": failed_rules,
-            "totalErrors": total_errors,
+            "skippedRules": skipped_rules,
+            "totalErrors": len(all_errors),
             "errors": all_errors,
-            "results": [result.to_dict() for result in results],
         }
+        if include_results:
+            summary["results"] = result_dicts
+        return summary
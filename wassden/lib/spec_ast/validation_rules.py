@@ -5,9 +5,11 @@ for validating spec documents using the AST-based parser.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from functools import cached_property
+from typing import Any, ClassVar
 
 from wassden.language_types import Language
 
@@ -22,7 +24,7 @@ class Severity(Enum):
     INFO = "info"
 
 
-@dataclass
+@dataclass(slots=True)
 class BlockLocation:
     """Location of a block in the document."""
 
@@ -36,7 +38,7 @@ class BlockLocation:
         return cls(line_start=block.line_start, line_end=block.line_end, section_path=block.get_context_path())
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationError:
     """Individual validation error."""
 
@@ -56,23 +58,30 @@ class ValidationError:
         return result
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValidationResult:
-    """Result of a validation rule execution."""
+    """Result of a validation rule execution.
+
+    Frozen because each rule hands out one shared instance for all of its passing runs.
+    """
 
     rule_id: str
     rule_name: str
     is_valid: bool
-    errors: list[ValidationError] = field(default_factory=list)
+    errors: Sequence[ValidationError] = ()
+    skipped: bool = False  # Not run because a prerequisite rule failed (fail-fast mode)
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary format."""
-        return {
+        """Convert to dictionary format; "skipped" is only present for rules skipped in fail-fast mode."""
+        result: dict[str, Any] = {
             "rule_id": self.rule_id,
             "rule_name": self.rule_name,
             "is_valid": self.is_valid,
             "errors": [error.to_dict() for error in self.errors],
         }
+        if self.skipped:
+            result["skipped"] = True
+        return result
 
 
 class ValidationContext:
@@ -107,6 +116,12 @@ class ValidationContext:
 class ValidationRule(ABC):
     """Base class for validation rules."""
 
+    # Rule IDs whose failure makes this rule's findings redundant (e.g. coverage checks on a
+    # document missing its required sections); in fail-fast mode the engine skips this rule
+    # when any of them failed earlier in the same run. Rules that check blocks on their own,
+    # such as ID formats, leave this empty so their findings are never hidden.
+    depends_on: ClassVar[tuple[str, ...]] = ()
+
     def __init__(self, language: Language = Language.JAPANESE) -> None:
         """Initialize validation rule.
 
@@ -142,18 +157,23 @@ class ValidationRule(ABC):
             Validation result with any errors found
         """
 
-    def _create_result(self, errors: list[ValidationError]) -> ValidationResult:
+    @cached_property
+    def _passing_result(self) -> ValidationResult:
+        """Result returned for every error-free run of this rule (errors is an empty tuple)."""
+        return ValidationResult(rule_id=self.rule_id, rule_name=self.rule_name, is_valid=True)
+
+    def _create_result(self, errors: Sequence[ValidationError]) -> ValidationResult:
         """Helper to create a validation result.
 
         Args:
             errors: List of validation errors
 
         Returns:
-            ValidationResult with is_valid set based on errors
+            ValidationResult with is_valid set based on errors (shared across calls when there are none)
         """
-        return ValidationResult(
-            rule_id=self.rule_id, rule_name=self.rule_name, is_valid=len(errors) == 0, errors=errors
-        )
+        if not errors:
+            return self._passing_result
+        return ValidationResult(rule_id=self.rule_id, rule_name=self.rule_name, is_valid=False, errors=errors)
 
 
 class StructureValidationRule(ValidationRule):
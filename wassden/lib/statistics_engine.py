@@ -6,10 +6,14 @@ confidence intervals, and statistical tests for experiment data analysis.
 Implements: REQ-04, TASK-01-03
 """
 
+import bisect
+import functools
 import math
+from collections.abc import Iterable, Sequence
 from typing import Any
 
 import numpy as np
+import numpy.typing as npt
 from scipy import stats
 
 from wassden.lib.experiment import StatisticalSummary
@@ -26,6 +30,13 @@ SIGNIFICANCE_LEVEL = 0.05  # Standard significance level (95% confidence)
 COHEN_D_NEGLIGIBLE = 0.2
 COHEN_D_SMALL = 0.5
 COHEN_D_MEDIUM = 0.8
+_EFFECT_SIZE_THRESHOLDS = (COHEN_D_NEGLIGIBLE, COHEN_D_SMALL, COHEN_D_MEDIUM)
+_EFFECT_SIZE_LABELS = ("negligible", "small", "medium", "large")
+
+# Constant tuple for isinstance checks in per-value loops (numpy scalars included, matching the array path)
+_NUMERIC_TYPES = (int, float, np.integer, np.floating)
+DEFAULT_CONFIDENCE_LEVEL = 0.95  # Confidence level reported in descriptive statistics
+PURE_PYTHON_STATS_MAX_N = 256  # Up to this size, pure-Python statistics beat the numpy/scipy path (~4x at 256)
 
 
 class StatisticsEngineError(Exception):
@@ -40,15 +51,42 @@ class InvalidDataError(StatisticsEngineError):
     """Raised when invalid data is provided for calculations."""
 
 
+# t critical values by (confidence_level, df); bounded in practice since t is only used for n < 30
+_T_CRITICAL_CACHE: dict[tuple[float, int], float] = {}
+
+
+def _t_critical(confidence_level: float, df: int) -> float:
+    """Two-sided critical value of Student's t distribution (memoized, SciPy ppf is costly)."""
+    key = (confidence_level, df)
+    value = _T_CRITICAL_CACHE.get(key)
+    if value is None:
+        value = _T_CRITICAL_CACHE[key] = float(stats.t.ppf((1 + confidence_level) / 2, df))
+    return value
+
+
+def _prime_t_critical(confidence_level: float, dfs: Iterable[int]) -> None:
+    """Compute uncached t critical values for several degrees of freedom in one SciPy call."""
+    missing = sorted({df for df in dfs if (confidence_level, df) not in _T_CRITICAL_CACHE})
+    if missing:
+        values = np.atleast_1d(stats.t.ppf((1 + confidence_level) / 2, np.array(missing))).tolist()
+        _T_CRITICAL_CACHE.update(((confidence_level, df), value) for df, value in zip(missing, values, strict=True))
+
+
+@functools.lru_cache(maxsize=16)
+def _z_critical(confidence_level: float) -> float:
+    """Two-sided critical value of the standard normal distribution (memoized)."""
+    return float(stats.norm.ppf((1 + confidence_level) / 2))
+
+
 class StatisticsEngine:
     """Engine for statistical calculations and analysis."""
 
     @staticmethod
-    def calculate_descriptive_stats(data: list[float]) -> StatisticalSummary:
+    def calculate_descriptive_stats(data: list[float] | npt.NDArray[np.floating[Any]]) -> StatisticalSummary:
         """Calculate descriptive statistics for numerical data.
 
         Args:
-            data: List of numerical values
+            data: List of numerical values, or a numeric numpy array (validated in bulk)
 
         Returns:
             Statistical summary containing mean, variance, std_dev, etc.
@@ -59,45 +97,147 @@ class StatisticsEngine:
 
         Implements: REQ-04 - 観点1: 平均値、分散、標準偏差を算出する
         """
-        if not data:
-            raise InsufficientDataError("Cannot calculate statistics for empty dataset")
+        # Arrays always take the vectorised path; the small-sample path would iterate them in Python
+        if not isinstance(data, np.ndarray) and 0 < len(data) <= PURE_PYTHON_STATS_MAX_N:
+            return StatisticsEngine._small_sample_stats(data)
+        summary, _ = StatisticsEngine._stats_with_array(data)
+        return summary
+
+    @staticmethod
+    def _small_sample_stats(data: Sequence[float]) -> StatisticalSummary:
+        """Calculate descriptive statistics for a small dataset in pure Python.
 
-        if len(data) < 1:
-            raise InsufficientDataError("At least 1 data point is required")
+        Uses an exactly rounded sum for the mean and a two-pass sum of squared
+        deviations for the variance, and derives the confidence interval from them,
+        avoiding array conversion and scipy calls for short series.
 
-        # Validate data - check for NaN, inf, or non-numeric values
+        Args:
+            data: Non-empty list of numerical values
+
+        Returns:
+            Statistical summary, as calculate_descriptive_stats
+
+        Raises:
+            InvalidDataError: If data contains invalid values
+        """
+        isfinite = math.isfinite
         clean_data = []
         for value in data:
-            if not isinstance(value, int | float):
+            if not isinstance(value, _NUMERIC_TYPES):
                 raise InvalidDataError(f"Non-numeric value found: {value}")
-            if math.isnan(value) or math.isinf(value):
+            if not isfinite(value):
                 raise InvalidDataError(f"Invalid numeric value found: {value}")
             clean_data.append(float(value))
 
-        # Calculate descriptive statistics using numpy for precision
-        np_data = np.array(clean_data)
+        n = len(clean_data)
+        mean = math.fsum(clean_data) / n
+        variance = math.fsum((x - mean) ** 2 for x in clean_data) / (n - 1) if n > 1 else 0.0
+        std_dev = math.sqrt(variance)
+
+        if n < MIN_SAMPLE_SIZE_FOR_CI:
+            confidence_interval = (mean, mean)
+        else:
+            # Same interval as _calculate_confidence_interval, from the mean and std_dev already computed
+            critical = (
+                _t_critical(DEFAULT_CONFIDENCE_LEVEL, n - 1)
+                if n < SMALL_SAMPLE_THRESHOLD
+                else _z_critical(DEFAULT_CONFIDENCE_LEVEL)
+            )
+            margin_of_error = critical * std_dev / math.sqrt(n)
+            confidence_interval = (mean - margin_of_error, mean + margin_of_error)
+
+        return StatisticalSummary(
+            mean=mean,
+            variance=variance,
+            std_dev=std_dev,
+            confidence_interval=confidence_interval,
+            sample_size=n,
+            min_value=min(clean_data),
+            max_value=max(clean_data),
+        )
 
-        mean = float(np.mean(np_data))
-        variance = float(np.var(np_data, ddof=1)) if len(clean_data) > 1 else 0.0
-        std_dev = float(np.std(np_data, ddof=1)) if len(clean_data) > 1 else 0.0
-        min_value = float(np.min(np_data))
-        max_value = float(np.max(np_data))
+    @staticmethod
+    def _stats_with_array(
+        data: Sequence[float] | npt.NDArray[np.floating[Any]],
+    ) -> tuple[StatisticalSummary, npt.NDArray[np.float64]]:
+        """Calculate descriptive statistics and also return the validated float array.
+
+        Args:
+            data: List of numerical values
+
+        Returns:
+            Tuple of (statistical summary, float64 array of the data) so callers can
+            reuse the converted array instead of converting the data again
+
+        Raises:
+            InsufficientDataError: If data is empty
+            InvalidDataError: If data contains invalid values
+        """
+        if len(data) == 0:
+            raise InsufficientDataError("Cannot calculate statistics for empty dataset")
+
+        # Validate data - check for NaN, inf, or non-numeric values
+        np_data = StatisticsEngine._to_float_array(data)
+
+        # Calculate descriptive statistics using numpy for precision
+        mean = float(np_data.mean())
+        variance = float(np_data.var(ddof=1)) if np_data.size > 1 else 0.0
+        std_dev = math.sqrt(variance)
+        min_value = float(np_data.min())
+        max_value = float(np_data.max())
 
         # Calculate 95% confidence interval
-        confidence_interval = StatisticsEngine._calculate_confidence_interval(clean_data, confidence_level=0.95)
+        confidence_interval = StatisticsEngine._calculate_confidence_interval(
+            np_data, confidence_level=DEFAULT_CONFIDENCE_LEVEL
+        )
 
-        return StatisticalSummary(
+        summary = StatisticalSummary(
             mean=mean,
             variance=variance,
             std_dev=std_dev,
             confidence_interval=confidence_interval,
-            sample_size=len(clean_data),
+            sample_size=int(np_data.size),
             min_value=min_value,
             max_value=max_value,
         )
+        return summary, np_data
+
+    @staticmethod
+    def _to_float_array(data: Sequence[float] | npt.NDArray[np.floating[Any]]) -> npt.NDArray[np.float64]:
+        """Convert data to a float array, rejecting non-numeric and non-finite values.
+
+        Numeric input is converted and checked in bulk; the per-value loop only runs
+        for mixed or object data, where it also finds the offending value to report.
+
+        Args:
+            data: Sequence of numerical values
+
+        Returns:
+            One-dimensional float64 array of the values
+
+        Raises:
+            InvalidDataError: If data contains non-numeric, NaN or infinite values
+        """
+        values = np.asarray(data)
+        if values.ndim == 1 and values.dtype.kind in "biuf":
+            array = values.astype(np.float64, copy=False)
+        else:
+            clean_data = []
+            for value in data:
+                if not isinstance(value, _NUMERIC_TYPES):
+                    raise InvalidDataError(f"Non-numeric value found: {value}")
+                clean_data.append(float(value))
+            array = np.array(clean_data, dtype=np.float64)
+
+        finite = np.isfinite(array)
+        if not finite.all():
+            raise InvalidDataError(f"Invalid numeric value found: {float(array[~finite][0])}")
+        return array
 
     @staticmethod
-    def _calculate_confidence_interval(data: list[float], confidence_level: float = 0.95) -> tuple[float, float]:
+    def _calculate_confidence_interval(
+        data: Sequence[float] | npt.NDArray[np.float64], confidence_level: float = 0.95
+    ) -> tuple[float, float]:
         """Calculate confidence interval for the mean.
 
         Args:
@@ -111,7 +251,7 @@ class StatisticsEngine:
         """
         if len(data) < MIN_SAMPLE_SIZE_FOR_CI:
             # For single data point, confidence interval equals the value
-            value = data[0] if data else 0.0
+            value = float(data[0]) if len(data) else 0.0
             return (value, value)
 
         n = len(data)
@@ -121,12 +261,10 @@ class StatisticsEngine:
         # Use t-distribution for small samples, normal for large samples
         if n < SMALL_SAMPLE_THRESHOLD:
             # t-distribution for small samples
-            t_critical = stats.t.ppf((1 + confidence_level) / 2, n - 1)
-            margin_of_error = t_critical * sem
+            margin_of_error = _t_critical(confidence_level, n - 1) * sem
         else:
             # Normal distribution for large samples
-            z_critical = stats.norm.ppf((1 + confidence_level) / 2)
-            margin_of_error = z_critical * sem
+            margin_of_error = _z_critical(confidence_level) * sem
 
         lower_bound = float(mean - margin_of_error)
         upper_bound = float(mean + margin_of_error)
@@ -155,19 +293,19 @@ class StatisticsEngine:
         if len(baseline_data) < MIN_COMPARISON_SAMPLES or len(comparison_data) < MIN_COMPARISON_SAMPLES:
             raise InsufficientDataError("At least 2 data points required in each dataset for comparison")
 
-        # Calculate statistics for both datasets
-        baseline_stats = StatisticsEngine.calculate_descriptive_stats(baseline_data)
-        comparison_stats = StatisticsEngine.calculate_descriptive_stats(comparison_data)
+        # Calculate statistics for both datasets, keeping the converted arrays for the tests below
+        baseline_stats, baseline_array = StatisticsEngine._stats_with_array(baseline_data)
+        comparison_stats, comparison_array = StatisticsEngine._stats_with_array(comparison_data)
 
         # Perform t-test to check for significant difference
-        t_statistic, p_value = stats.ttest_ind(baseline_data, comparison_data)
+        t_statistic, p_value = stats.ttest_ind(baseline_array, comparison_array)
 
-        # Perform F-test for variance comparison
-        f_statistic = np.var(comparison_data, ddof=1) / np.var(baseline_data, ddof=1)
-        f_p_value = 2 * min(
-            stats.f.cdf(f_statistic, len(comparison_data) - 1, len(baseline_data) - 1),
-            1 - stats.f.cdf(f_statistic, len(comparison_data) - 1, len(baseline_data) - 1),
-        )
+        # Perform F-test for variance comparison, reusing the sample variances
+        # (numpy division keeps the inf/nan result for a zero baseline variance)
+        f_statistic = np.float64(comparison_stats.variance) / baseline_stats.variance
+        dfn = comparison_array.size - 1
+        dfd = baseline_array.size - 1
+        f_p_value = 2 * min(stats.f.cdf(f_statistic, dfn, dfd), stats.f.sf(f_statistic, dfn, dfd))
 
         # Calculate effect size (Cohen's d)
         pooled_std = math.sqrt(
@@ -210,14 +348,8 @@ class StatisticsEngine:
         Returns:
             Interpretation string
         """
-        abs_d = abs(cohens_d)
-        if abs_d < COHEN_D_NEGLIGIBLE:
-            return "negligible"
-        if abs_d < COHEN_D_SMALL:
-            return "small"
-        if abs_d < COHEN_D_MEDIUM:
-            return "medium"
-        return "large"
+        # Index of the first threshold above |d| (a value equal to a threshold falls in the next band)
+        return _EFFECT_SIZE_LABELS[bisect.bisect_right(_EFFECT_SIZE_THRESHOLDS, abs(cohens_d))]
 
     @staticmethod
     def validate_statistical_assumptions(data: list[float]) -> dict[str, Any]:
@@ -236,10 +368,11 @@ class StatisticsEngine:
             }
 
         results = {}
+        values = np.asarray(data, dtype=np.float64)
 
         # Normality test (Shapiro-Wilk for n < 50, Anderson-Darling for n >= 50)
-        if len(data) < SHAPIRO_WILK_THRESHOLD:
-            stat, p_value = stats.shapiro(data)
+        if values.size < SHAPIRO_WILK_THRESHOLD:
+            stat, p_value = stats.shapiro(values)
             results["normality_test"] = {
                 "test": "shapiro_wilk",
                 "statistic": float(stat),
@@ -248,7 +381,7 @@ class StatisticsEngine:
                 "applicable": True,
             }
         else:
-            result = stats.anderson(data, dist="norm")
+            result = stats.anderson(values, dist="norm")
             critical_value = result.critical_values[2]  # 5% significance level
             results["normality_test"] = {
                 "test": "anderson_darling",
@@ -258,22 +391,24 @@ class StatisticsEngine:
                 "applicable": True,
             }
 
-        # Outlier detection using IQR method
-        q1 = np.percentile(data, 25)
-        q3 = np.percentile(data, 75)
+        # Outlier detection using IQR method (boolean mask instead of a per-value scan)
+        # One call computes both quartiles from a single partition (numpy selects rather than sorts);
+        # linear interpolation is kept explicitly since "lower"/"nearest" would move the fences
+        q1, q3 = np.percentile(values, [25, 75], method="linear")
         iqr = q3 - q1
         lower_bound = q1 - 1.5 * iqr
         upper_bound = q3 + 1.5 * iqr
 
-        outliers = [x for x in data if x < lower_bound or x > upper_bound]
+        outlier_mask = (values < lower_bound) | (values > upper_bound)
+        outlier_count = int(np.count_nonzero(outlier_mask))
 
         results["outlier_detection"] = {
             "method": "IQR",
             "lower_bound": float(lower_bound),
             "upper_bound": float(upper_bound),
-            "outliers": outliers,
-            "outlier_count": len(outliers),
-            "outlier_percentage": len(outliers) / len(data) * 100,
+            "outliers": values[outlier_mask].tolist(),
+            "outlier_count": outlier_count,
+            "outlier_percentage": outlier_count / values.size * 100,
             "applicable": True,
         }
 
@@ -284,7 +419,8 @@ class StatisticsEngine:
         """Aggregate multiple experiment results with statistical analysis.
 
         Args:
-            results: List of experiment result dictionaries
+            results: List of experiment result dictionaries; finite int, float and numpy
+                integer/floating scalar values are aggregated as metrics
 
         Returns:
             Aggregated statistical summary
@@ -295,18 +431,27 @@ class StatisticsEngine:
         if not results:
             raise InsufficientDataError("No experiment results provided for aggregation")
 
-        # Extract numerical metrics from results
+        # Extract numerical metrics from results (finite numbers only), one dict lookup per value
         metrics: dict[str, list[float]] = {}
+        isfinite = math.isfinite  # Local alias: avoids a module attribute lookup per value
         for result in results:
             for key, value in result.items():
-                if isinstance(value, int | float) and not math.isnan(value) and not math.isinf(value):
-                    if key not in metrics:
-                        metrics[key] = []
-                    metrics[key].append(float(value))
+                if isinstance(value, _NUMERIC_TYPES) and isfinite(value):
+                    metrics.setdefault(key, []).append(float(value))
 
         if not metrics:
             raise InvalidDataError("No valid numerical metrics found in experiment results")
 
+        # Fetch the t critical values for all small-sample metrics with one vectorised call
+        _prime_t_critical(
+            DEFAULT_CONFIDENCE_LEVEL,
+            (
+                len(values) - 1
+                for values in metrics.values()
+                if MIN_SAMPLE_SIZE_FOR_CI <= len(values) < SMALL_SAMPLE_THRESHOLD
+            ),
+        )
+
         # Calculate statistics for each metric
         aggregated_stats = {}
         for metric_name, values in metrics.items():
@@ -1,6 +1,8 @@
 """Traceability analysis utilities."""
 
+import functools
 import re
+from bisect import bisect_left
 from typing import Any
 
 # Import common validation functions
@@ -12,13 +14,40 @@ from .validation_common import (
     extract_tr_ids,
 )
 
+_BOLD_NAME_PATTERN = re.compile(r"\*\*([a-zA-Z0-9_-]+)\*\*")
+_BOLD_TEST_NAME_PATTERN = re.compile(r"\*\*([a-zA-Z0-9_-]*test[a-zA-Z0-9_-]*)\*\*")
+_TASK_ID_PATTERN = re.compile(r"TASK-\d{2}(?:-\d{2}){0,2}")
+_TASK_ID_WORD_PATTERN = re.compile(r"\bTASK-\d{2}(?:-\d{2}){0,2}\b")
+_DESIGN_BOUNDARY_PATTERN = re.compile(r"REQ-\d{2}|TR-\d{2}|##")
+_DEPENDENCY_LINE_PATTERN = re.compile(r"^[^\n]*(?:依存|(?i:depends))[^\n]*", re.MULTILINE)
+
+# Recent document sets whose matrices are kept
+_MATRIX_CACHE_SIZE = 16
+
+# Characters after an ID mention that are searched for related bold names
+_MAPPING_WINDOW = 500
+
 
 def build_traceability_matrix(
     requirements_content: str | None,
     design_content: str | None,
     tasks_content: str | None,
 ) -> dict[str, Any]:
-    """Build a complete traceability matrix from spec documents."""
+    """Build a complete traceability matrix from spec documents.
+
+    Matrices are memoized on the document contents, so repeated calls for unchanged
+    specs skip the scans. Each call returns its own copy that callers may modify.
+    """
+    return _copy_matrix(_build_traceability_matrix_cached(requirements_content, design_content, tasks_content))
+
+
+@functools.lru_cache(maxsize=_MATRIX_CACHE_SIZE)
+def _build_traceability_matrix_cached(
+    requirements_content: str | None,
+    design_content: str | None,
+    tasks_content: str | None,
+) -> dict[str, Any]:
+    """Build the shared matrix for a set of documents; never hand it out uncopied."""
     matrix: dict[str, Any] = {
         "requirements": set(),
         "test_requirements": set(),
@@ -32,14 +61,21 @@ def build_traceability_matrix(
     }
 
     _extract_all_ids(matrix, requirements_content, design_content, tasks_content)
-    _build_req_to_design_mapping(matrix, requirements_content, design_content)
-    _build_tr_to_design_mapping(matrix, requirements_content, design_content)
+    _build_design_mappings(matrix, requirements_content, design_content)
     _build_design_to_tasks_mapping(matrix, design_content, tasks_content)
     _extract_task_dependencies(matrix, tasks_content)
 
     return matrix
 
 
+def _copy_matrix(matrix: dict[str, Any]) -> dict[str, Any]:
+    """Copy a matrix down to its ID sets so the cached original stays untouched."""
+    return {
+        key: {name: set(targets) for name, targets in value.items()} if isinstance(value, dict) else set(value)
+        for key, value in matrix.items()
+    }
+
+
 def _extract_all_ids(
     matrix: dict[str, Any], requirements_content: str | None, design_content: str | None, tasks_content: str | None
 ) -> None:
@@ -57,44 +93,51 @@ def _extract_all_ids(
         matrix["tasks"] = extract_task_ids(tasks_content)
 
 
-def _build_req_to_design_mapping(
-    matrix: dict[str, Any], requirements_content: str | None, design_content: str | None
-) -> None:
-    """Build mapping from requirements to design components."""
-    if not (requirements_content and design_content):
-        return
-
-    for req_id in matrix["requirements"]:
-        pattern = rf"{req_id}.*?(?=REQ-\d{{2}}|##|$)"
-        matches = re.findall(pattern, design_content, re.DOTALL)
-
-        related_components = set()
-        for match in matches:
-            comp_matches = re.findall(r"\*\*([a-zA-Z0-9_-]+)\*\*", match[:500])
-            related_components.update(comp_matches)
-
-        if related_components:
-            matrix["req_to_design"][req_id] = related_components
-
-
-def _build_tr_to_design_mapping(
+def _build_design_mappings(
     matrix: dict[str, Any], requirements_content: str | None, design_content: str | None
 ) -> None:
-    """Build mapping from test requirements to test scenarios."""
+    """Build requirement-to-component and TR-to-scenario mappings from one design scan."""
     if not (requirements_content and design_content):
         return
 
-    for tr_id in matrix["test_requirements"]:
-        pattern = rf"{tr_id}.*?(?=TR-\d{{2}}|##|$)"
-        matches = re.findall(pattern, design_content, re.DOTALL)
-
-        related_scenarios = set()
-        for match in matches:
-            scenario_matches = re.findall(r"\*\*([a-zA-Z0-9_-]*test[a-zA-Z0-9_-]*)\*\*", match[:500])
-            related_scenarios.update(scenario_matches)
-
-        if related_scenarios:
-            matrix["tr_to_design"][tr_id] = related_scenarios
+    boundaries = list(_DESIGN_BOUNDARY_PATTERN.finditer(design_content))
+    matrix["req_to_design"] = _map_ids_to_bold_names(
+        design_content,
+        [boundary for boundary in boundaries if not boundary.group().startswith("TR-")],
+        matrix["requirements"],
+        _BOLD_NAME_PATTERN,
+    )
+    matrix["tr_to_design"] = _map_ids_to_bold_names(
+        design_content,
+        [boundary for boundary in boundaries if not boundary.group().startswith("REQ-")],
+        matrix["test_requirements"],
+        _BOLD_TEST_NAME_PATTERN,
+    )
+
+
+def _map_ids_to_bold_names(
+    content: str, boundaries: list[re.Match[str]], ids: set[str], name_pattern: re.Pattern[str]
+) -> dict[str, set[str]]:
+    """Map each ID to the bold names that follow it.
+
+    ``boundaries`` holds the ID mentions of one family plus the ``##`` markers. An ID
+    mention owns the text up to the next boundary; only the first ``_MAPPING_WINDOW``
+    characters of that span are searched for names.
+    """
+    mapping: dict[str, set[str]] = {}
+    content_length = len(content)
+
+    for index, boundary in enumerate(boundaries):
+        found_id = boundary.group()
+        if found_id not in ids:
+            continue
+        start = boundary.start()
+        end = boundaries[index + 1].start() if index + 1 < len(boundaries) else content_length
+        names = name_pattern.findall(content, start, min(end, start + _MAPPING_WINDOW))
+        if names:
+            mapping.setdefault(found_id, set()).update(names)
+
+    return mapping
 
 
 def _build_design_to_tasks_mapping(
@@ -104,31 +147,28 @@ def _build_design_to_tasks_mapping(
     if not (design_content and tasks_content):
         return
 
-    # Map design components to tasks
-    for component in matrix["design_components"]:
-        if component in tasks_content:
-            related_tasks = set()
-            pattern = rf"{re.escape(component)}.*?TASK-\d{{2}}(?:-\d{{2}}){{0,2}}"
-            matches = re.findall(pattern, tasks_content, re.DOTALL)
-            for match in matches:
-                task_matches = re.findall(r"TASK-\d{2}(?:-\d{2}){0,2}", match)
-                related_tasks.update(task_matches)
-
-            if related_tasks:
-                matrix["design_to_tasks"][component] = related_tasks
-
-    # Map test scenarios to tasks
-    for scenario in matrix["test_scenarios"]:
-        if scenario in tasks_content:
-            related_tasks = set()
-            pattern = rf"{re.escape(scenario)}.*?TASK-\d{{2}}(?:-\d{{2}}){{0,2}}"
-            matches = re.findall(pattern, tasks_content, re.DOTALL)
-            for match in matches:
-                task_matches = re.findall(r"TASK-\d{2}(?:-\d{2}){0,2}", match)
-                related_tasks.update(task_matches)
-
-            if related_tasks:
-                matrix["design_to_tasks"][scenario] = related_tasks
+    task_matches = list(_TASK_ID_PATTERN.finditer(tasks_content))
+    if not task_matches:
+        return
+    task_starts = [task_match.start() for task_match in task_matches]
+
+    # Map design components first, then test scenarios
+    for name in (*matrix["design_components"], *matrix["test_scenarios"]):
+        related_tasks = set()
+        position = tasks_content.find(name)
+        while position != -1:
+            # Each mention links to the first task ID that starts after it
+            index = bisect_left(task_starts, position + len(name))
+            if index == len(task_starts):
+                break
+            task_match = task_matches[index]
+            related_tasks.add(task_match.group())
+            position = tasks_content.find(name, task_match.end())
+
+        if related_tasks:
+            # Task IDs embedded in the name itself are related as well
+            related_tasks.update(_TASK_ID_PATTERN.findall(name))
+            matrix["design_to_tasks"][name] = related_tasks
 
 
 def _extract_task_dependencies(matrix: dict[str, Any], tasks_content: str | None) -> None:
@@ -136,41 +176,50 @@ def _extract_task_dependencies(matrix: dict[str, Any], tasks_content: str | None
     if not tasks_content:
         return
 
-    for line in tasks_content.split("\n"):
-        if "依存" in line or "Depends" in line.lower():
-            task_match = re.search(r"\bTASK-\d{2}(?:-\d{2}){0,2}\b", line)
-            if task_match:
-                task_id = task_match.group(0)
-                dep_part = line.split(":", 1)[-1] if ":" in line else line
-                dep_ids = re.findall(r"\bTASK-\d{2}(?:-\d{2}){0,2}\b", dep_part)
-                if dep_ids and dep_ids[0] != task_id:  # Avoid self-dependency
-                    matrix["task_dependencies"][task_id] = set(dep_ids)
+    for line_match in _DEPENDENCY_LINE_PATTERN.finditer(tasks_content):
+        line_start, line_end = line_match.span()
+        task_match = _TASK_ID_WORD_PATTERN.search(tasks_content, line_start, line_end)
+        if task_match:
+            task_id = task_match.group(0)
+            colon = tasks_content.find(":", line_start, line_end)
+            dep_start = line_start if colon == -1 else colon + 1
+            dep_ids = _TASK_ID_WORD_PATTERN.findall(tasks_content, dep_start, line_end)
+            if dep_ids and dep_ids[0] != task_id:  # Avoid self-dependency
+                matrix["task_dependencies"][task_id] = set(dep_ids)
 
 
 def check_circular_dependencies(dependencies: dict[str, set[str]]) -> list[str]:
-    """Check for circular dependencies in task graph."""
+    """Check for circular dependencies in task graph.
+
+    The depth-first search keeps its own stack, so long dependency chains are not bounded
+    by the interpreter recursion limit.
+    """
     errors = []
+    visited: set[str] = set()
 
-    def has_cycle(node: str, visited: set[str], rec_stack: set[str]) -> bool:
-        visited.add(node)
-        rec_stack.add(node)
+    for root, root_dependencies in dependencies.items():
+        if root in visited:
+            continue
+        visited.add(root)
+        path = {root}
+        stack = [(root, iter(root_dependencies))]
 
-        if node in dependencies:
-            for neighbor in dependencies[node]:
+        while stack:
+            node, neighbors = stack[-1]
+            for neighbor in neighbors:
                 if neighbor not in visited:
-                    if has_cycle(neighbor, visited, rec_stack):
-                        return True
-                elif neighbor in rec_stack:
+                    visited.add(neighbor)
+                    path.add(neighbor)
+                    stack.append((neighbor, iter(dependencies.get(neighbor, ()))))
+                    break
+                if neighbor in path:
+                    # Report the first cycle reached from this root only
                     errors.append(f"Circular dependency: {node} -> {neighbor}")
-                    return True
-
-        rec_stack.remove(node)
-        return False
-
-    visited: set[str] = set()
-    for node in dependencies:
-        if node not in visited:
-            has_cycle(node, visited, set())
+                    stack.clear()
+                    break
+            else:
+                path.remove(node)
+                stack.pop()
 
     return errors
 
@@ -187,29 +236,29 @@ def calculate_coverage_metrics(matrix: dict[str, Any]) -> dict[str, float]:
 
     # Requirement coverage: % of requirements with design references
     if matrix["requirements"]:
-        covered_reqs = len([r for r in matrix["requirements"] if r in matrix["req_to_design"]])
+        covered_reqs = len(matrix["requirements"] & matrix["req_to_design"].keys())
         metrics["requirement_coverage"] = (covered_reqs / len(matrix["requirements"])) * 100
 
     # Test requirement coverage: % of TRs with design references
     if matrix["test_requirements"]:
-        covered_trs = len([tr for tr in matrix["test_requirements"] if tr in matrix["tr_to_design"]])
+        covered_trs = len(matrix["test_requirements"] & matrix["tr_to_design"].keys())
         metrics["test_requirement_coverage"] = (covered_trs / len(matrix["test_requirements"])) * 100
 
     # Design coverage: % of design components with task references
     if matrix["design_components"]:
-        covered_components = len([c for c in matrix["design_components"] if c in matrix["design_to_tasks"]])
+        covered_components = len(matrix["design_components"] & matrix["design_to_tasks"].keys())
         metrics["design_coverage"] = (covered_components / len(matrix["design_components"])) * 100
 
     # Test scenario coverage: % of test scenarios with task references
     if matrix["test_scenarios"]:
-        covered_scenarios = len([s for s in matrix["test_scenarios"] if s in matrix["design_to_tasks"]])
+        covered_scenarios = len(matrix["test_scenarios"] & matrix["design_to_tasks"].keys())
         metrics["test_scenario_coverage"] = (covered_scenarios / len(matrix["test_scenarios"])) * 100
 
     # Task coverage: % of tasks with proper dependencies
     if matrix["tasks"]:
         tasks_with_deps = len(matrix["task_dependencies"])
         # Assume first phase tasks don't need dependencies
-        expected_deps = max(0, len(matrix["tasks"]) - len([t for t in matrix["tasks"] if t.startswith("TASK-01-")]))
+        expected_deps = max(0, len(matrix["tasks"]) - sum(1 for t in matrix["tasks"] if t.startswith("TASK-01-")))
         if expected_deps > 0:
             metrics["task_coverage"] = (tasks_with_deps / expected_deps) * 100
         else:
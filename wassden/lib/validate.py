@@ -1,6 +1,6 @@
 """Validation utilities for spec documents."""
 
-import re
+import functools
 from typing import Any
 
 from wassden.language_types import Language
@@ -11,37 +11,71 @@ from .spec_ast.validation_compat import (
     validate_tasks_ast,
 )
 
+# ID format validators live with the other shared validation helpers; re-exported here
+from .validation_common import validate_req_id, validate_task_id
 
-def validate_req_id(req_id: str) -> bool:
-    """Validate requirement ID format (REQ-XX where XX is 01-99)."""
-    if not re.match(r"^REQ-\d{2}$", req_id):
-        return False
-    # Extract the number part and check it's not 00
-    num_part = req_id.split("-")[1]
-    return num_part != "00"
+__all__ = [
+    "validate_design",
+    "validate_req_id",
+    "validate_requirements",
+    "validate_task_id",
+    "validate_tasks",
+]
 
+# Validation results per distinct input; MCP clients re-validate unchanged specs repeatedly
+_VALIDATION_CACHE_SIZE = 64
 
-def validate_task_id(task_id: str) -> bool:
-    """Validate task ID format (TASK-XX-XX or TASK-XX-XX-XX where XX is 01-99)."""
-    if not re.match(r"^TASK-\d{2}(-\d{2}){1,2}$", task_id):
-        return False
-    # Extract all number parts and check none are 00
-    parts = task_id.split("-")[1:]  # Remove "TASK" part
-    return all(part != "00" for part in parts)
 
+def _copy_result(result: dict[str, Any]) -> dict[str, Any]:
+    """Copy a cached result for a caller: a new dict and issues list.
 
-def validate_requirements(content: str, language: Language = Language.JAPANESE) -> dict[str, Any]:
-    """Validate requirements document using AST validation."""
+    Nested values such as stats and foundSections stay shared with the cache and
+    are read-only for callers.
+    """
+    return {**result, "issues": list(result["issues"])}
+
+
+@functools.lru_cache(maxsize=_VALIDATION_CACHE_SIZE)
+def _validate_requirements_cached(content: str, language: Language) -> dict[str, Any]:
+    """Validate requirements once per distinct input."""
     return validate_requirements_ast(content, language)
 
 
-def validate_design(content: str, requirements_content: str | None = None) -> dict[str, Any]:
-    """Validate design document using AST validation."""
+@functools.lru_cache(maxsize=_VALIDATION_CACHE_SIZE)
+def _validate_design_cached(content: str, requirements_content: str | None) -> dict[str, Any]:
+    """Validate design once per distinct input."""
     return validate_design_ast(content, requirements_content)
 
 
+@functools.lru_cache(maxsize=_VALIDATION_CACHE_SIZE)
+def _validate_tasks_cached(
+    content: str, requirements_content: str | None, design_content: str | None
+) -> dict[str, Any]:
+    """Validate tasks once per distinct input."""
+    return validate_tasks_ast(content, requirements_content, design_content)
+
+
+def validate_requirements(content: str, language: Language = Language.JAPANESE) -> dict[str, Any]:
+    """Validate requirements document using AST validation.
+
+    Results are cached per input; callers get their own dict and issues list (see _copy_result).
+    """
+    return _copy_result(_validate_requirements_cached(content, language))
+
+
+def validate_design(content: str, requirements_content: str | None = None) -> dict[str, Any]:
+    """Validate design document using AST validation.
+
+    Results are cached per input; callers get their own dict and issues list (see _copy_result).
+    """
+    return _copy_result(_validate_design_cached(content, requirements_content))
+
+
 def validate_tasks(
     content: str, requirements_content: str | None = None, design_content: str | None = None
 ) -> dict[str, Any]:
-    """Validate tasks document using AST validation."""
-    return validate_tasks_ast(content, requirements_content, design_content)
+    """Validate tasks document using AST validation.
+
+    Results are cached per input; callers get their own dict and issues list (see _copy_result).
+    """
+    return _copy_result(_validate_tasks_cached(content, requirements_content, design_content))
@@ -4,8 +4,9 @@ This module validates requirements against EARS patterns.
 Initial version supports only Ubiquitous pattern.
 """
 
+import functools
 import re
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import markdown
 from pydantic import BaseModel, Field
@@ -13,6 +14,137 @@ from pydantic import BaseModel, Field
 from wassden.i18n.core import get_i18n
 from wassden.language_types import Language
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Markdown list item formats, matched against the line without its indentation
+_BULLET_LIST_ITEM_PATTERN = re.compile(r"[-*+]\s+(.+)$")  # Standard and indented markdown lists
+_NUMBERED_LIST_ITEM_PATTERN = re.compile(r"\d+\.\s+(.+)$")  # Standard and indented numbered lists
+_BULLET_POINT_ITEM_PATTERN = re.compile(r"•\s+(.+)$")  # Bullet points, only when not indented
+
+# Inline markdown markup removed from requirement text
+_BOLD_PATTERN = re.compile(r"\*\*(.+?)\*\*")
+_ITALIC_PATTERN = re.compile(r"\*(.+?)\*")
+_CODE_PATTERN = re.compile(r"`(.+?)`")
+_LINK_PATTERN = re.compile(r"\[(.+?)\]\(.+?\)")
+
+# HTML cleanup for list items rendered by the markdown parser
+_HTML_TAG_PATTERN = re.compile(r"<[^>]+>")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_HTML_HEADING_PATTERN = re.compile(r"<h[1-6][^>]*>.*?</h[1-6]>")
+_HTML_HEADING_OPEN_PATTERN = re.compile(r"<h[1-6][^>]*>", re.IGNORECASE)
+_HTML_HEADING_CLOSE_PATTERN = re.compile(r"</h[1-6]>", re.IGNORECASE)
+_HTML_LIST_ITEM_PATTERN = re.compile(r"<li[^>]*>(.*?)</li>", re.DOTALL)
+
+# REQ-ID prefixes stripped before EARS validation: valid IDs first, then malformed
+# ones such as REQ-ABC, REQ-, REQ:, REQ-01-02
+_REQ_ID_PREFIX_PATTERN = re.compile(r"^(REQ-\d+|TR-\d+|NFR-\d+|KPI-\d+):\s*(.+)$")
+_LOOSE_REQ_ID_PREFIX_PATTERN = re.compile(
+    r"^(REQ[-A-Za-z0-9]*|TR[-A-Za-z0-9]*|NFR[-A-Za-z0-9]*|KPI[-A-Za-z0-9]*):\s*(.+)$"
+)
+
+
+# Recent documents whose EARS results are kept
+_EARS_CACHE_SIZE = 32
+
+# Headers that open the functional requirements section, tried in order
+_FUNCTIONAL_HEADERS = (
+    "機能要件（EARS）",
+    ". 機能要件",
+    "## 6. Functional Requirements",
+    "機能要件",
+    "Functional Requirements",
+)
+# Functional headers as searched in rendered HTML; "Functional Requirements" must not
+# be part of "Non-Functional Requirements"
+_FUNCTIONAL_HEADER_HTML_PATTERNS = tuple(
+    re.compile(
+        r"(?<!Non-)Functional Requirements" if header == "Functional Requirements" else re.escape(header),
+        re.IGNORECASE,
+    )
+    for header in _FUNCTIONAL_HEADERS
+)
+# Matches wherever any functional header could; the HTML extraction is case-insensitive
+_FUNCTIONAL_HEADER_PATTERN = re.compile("|".join(map(re.escape, _FUNCTIONAL_HEADERS)), re.IGNORECASE)
+
+# Acceptance criteria, test criteria, notes and remarks are not requirements; one
+# case-insensitive alternation replaces a search per phrase
+_NON_REQUIREMENT_PATTERN = re.compile(
+    "|".join(
+        (
+            r"受け入れ観点",  # Acceptance criteria
+            r"受入観点",  # Acceptance criteria (alternative)
+            r"Acceptance criteria",
+            r"テスト観点",  # Test criteria
+            r"Test criteria",
+            r"注意事項",  # Notes
+            r"Note:",
+            r"備考",  # Remarks
+            r"Remark:",
+        )
+    ),
+    re.IGNORECASE,
+)
+
+
+# Japanese ubiquitous requirement prefix and action suffixes used to explain violations
+_JA_SYSTEM_PREFIXES = ("システムは", "本システムは")
+_JA_ACTION_SUFFIXES = ("すること。", "する。", "すること", "する")
+_JA_KOTO_SUFFIX_PATTERN = re.compile(r"[あ-ん]ること[。]?$")
+_JA_KOTO_SUFFIX_LENGTH = len("あること")
+_JA_SURU_SUFFIX_LENGTH = len("する")
+
+
+def _is_japanese_ubiquitous(req: str) -> bool:
+    """Check a requirement against the Japanese ubiquitous pattern without backtracking.
+
+    Equivalent to ``re.match(r"^(システムは|本システムは).+([あ-ん]ること|すること|する)[。]?$", req)``:
+    the greedy ``.+`` only needs one non-newline character between the prefix and the suffix,
+    so prefix and suffix are tested directly instead of letting the regex backtrack on near misses.
+    """
+    prefix = next((prefix for prefix in _JA_SYSTEM_PREFIXES if req.startswith(prefix)), None)
+    if prefix is None:
+        return False
+    # $ also matches before a final newline, and the optional 。 precedes it
+    body = req.removesuffix("\n").removesuffix("。")
+    if "\n" in body:
+        return False
+    if body.endswith("ること") and len(body) >= _JA_KOTO_SUFFIX_LENGTH and "あ" <= body[-4] <= "ん":
+        suffix_length = _JA_KOTO_SUFFIX_LENGTH
+    elif body.endswith("する"):
+        suffix_length = _JA_SURU_SUFFIX_LENGTH
+    else:
+        return False
+    return len(body) > len(prefix) + suffix_length
+
+
+@functools.lru_cache(maxsize=1)
+def _markdown_converter() -> markdown.Markdown:
+    """Return the shared Markdown converter, building its extensions only once."""
+    return markdown.Markdown(extensions=["toc"])
+
+
+def _strip_inline_markdown(text: str) -> str:
+    """Remove bold, italic, code and link markup, in that order.
+
+    The passes stay sequential because an earlier one can expose markup for a later one
+    (``**`code`**``). A pass only runs when its marker character is present.
+    """
+    if "*" in text:
+        text = _BOLD_PATTERN.sub(r"\1", text)
+        text = _ITALIC_PATTERN.sub(r"\1", text)
+    if "`" in text:
+        text = _CODE_PATTERN.sub(r"\1", text)
+    if "[" in text:
+        text = _LINK_PATTERN.sub(r"\1", text)
+    return text
+
+
+def _strip_req_id_prefix(text: str) -> str:
+    """Strip a leading REQ-ID prefix (valid or malformed) from requirement text."""
+    match = _REQ_ID_PREFIX_PATTERN.match(text) or _LOOSE_REQ_ID_PREFIX_PATTERN.match(text)
+    return match.group(2).strip() if match else text
+
 
 class EARSViolation(BaseModel):
     """Represents an EARS pattern violation."""
@@ -71,7 +203,12 @@ class EARSValidator:
         Returns:
             Validation result with violations
         """
-        pattern_regex = self.ubiquitous_patterns.get(self.language, self.ubiquitous_patterns["en"])
+        # The Japanese pattern is checked with prefix/suffix tests instead of its regex
+        is_ubiquitous: Callable[[str], object] = (
+            _is_japanese_ubiquitous
+            if self.language == "ja"
+            else self.ubiquitous_patterns.get(self.language, self.ubiquitous_patterns["en"]).match
+        )
         violations = []
         matched_count = 0
 
@@ -80,13 +217,14 @@ class EARSValidator:
             if not req:  # Skip empty lines
                 continue
 
-            if pattern_regex.match(req):
+            if is_ubiquitous(req):
                 matched_count += 1
             else:
                 reason = self._get_violation_reason(req)
                 violations.append(EARSViolation(line=i, text=req, reason=reason))
 
-        total = len([r for r in requirements if r.strip()])
+        # Every non-empty requirement either matched or produced a violation
+        total = matched_count + len(violations)
         rate = matched_count / total if total > 0 else 0.0
 
         return EARSValidationResult(
@@ -108,9 +246,9 @@ class EARSValidator:
 
     def _get_japanese_violation_reason(self, req: str) -> str:
         """Get Japanese violation reason."""
-        if not req.startswith(("システムは", "本システムは")):
+        if not req.startswith(_JA_SYSTEM_PREFIXES):
             return str(self.i18n.t("validation_errors.ears.missing_system_prefix_ja"))
-        if not (req.endswith(("すること。", "する。", "すること", "する")) or re.search(r"[あ-ん]ること[。]?$", req)):
+        if not (req.endswith(_JA_ACTION_SUFFIXES) or _JA_KOTO_SUFFIX_PATTERN.search(req)):
             return str(self.i18n.t("validation_errors.ears.missing_action_suffix_ja"))
         return str(self.i18n.t("validation_errors.ears.pattern_mismatch_ja"))
 
@@ -134,53 +272,45 @@ class EARSValidator:
         Returns:
             List of requirement texts
         """
-        # Use markdown parser to convert to HTML and parse it properly
-        md = markdown.Markdown(extensions=["toc"])
-        html_content = md.convert(markdown_text)
+        # Without any functional header neither extractor can find a section,
+        # so skip the markdown conversion entirely
+        if not _FUNCTIONAL_HEADER_PATTERN.search(markdown_text):
+            return []
 
-        functional_headers = [
-            "機能要件（EARS）",
-            ". 機能要件",
-            "## 6. Functional Requirements",
-            "機能要件",
-            "Functional Requirements",
-        ]
+        # Use markdown parser to convert to HTML and parse it properly
+        html_content = _markdown_converter().reset().convert(markdown_text)
 
         # Try HTML-based extraction first
-        requirements = self._extract_from_html(html_content, functional_headers)
+        requirements = self._extract_from_html(html_content)
 
         # Fallback to line-by-line if HTML parsing didn't work
         if not requirements:
-            requirements = self._extract_from_text(markdown_text, functional_headers)
+            requirements = self._extract_from_text(markdown_text, _FUNCTIONAL_HEADERS)
 
         return requirements
 
-    def _extract_from_html(self, html_content: str, functional_headers: list[str]) -> list[str]:
+    def _extract_from_html(self, html_content: str) -> list[str]:
         """Extract requirements from HTML content."""
-        requirements = []
+        requirements: list[str] = []
 
-        for header in functional_headers:
-            # Look for the header in HTML - be more specific to avoid substring matches
-            if header == "Functional Requirements":
-                # For this header, ensure it's not part of "Non-Functional Requirements"
-                header_pattern = r"<h[1-6][^>]*>.*?(?<!Non-)Functional Requirements.*?</h[1-6]>"
-            else:
-                header_pattern = rf"<h[1-6][^>]*>.*?{re.escape(header)}.*?</h[1-6]>"
-            header_match = re.search(header_pattern, html_content, re.IGNORECASE | re.DOTALL)
+        # A header matches when its text follows the first heading tag and a closing
+        # heading tag follows it; headers are tried in order of preference
+        opening_match = _HTML_HEADING_OPEN_PATTERN.search(html_content)
+        if not opening_match:
+            return requirements
 
-            if header_match:
-                # Find content after this header until next header
-                start_pos = header_match.end()
-                next_header_pattern = r"<h[1-6][^>]*>.*?</h[1-6]>"
-                remaining_content = html_content[start_pos:]
-                next_header_match = re.search(next_header_pattern, remaining_content)
+        for header_pattern in _FUNCTIONAL_HEADER_HTML_PATTERNS:
+            header_match = header_pattern.search(html_content, opening_match.end())
+            closing_match = header_match and _HTML_HEADING_CLOSE_PATTERN.search(html_content, header_match.end())
 
-                section_content = (
-                    remaining_content[: next_header_match.start()] if next_header_match else remaining_content
-                )
+            if closing_match:
+                # Find content after this header until next header, scanning in place
+                start_pos = closing_match.end()
+                next_header_match = _HTML_HEADING_PATTERN.search(html_content, start_pos)
+                end_pos = next_header_match.start() if next_header_match else len(html_content)
 
                 # Extract list items from this section using HTML
-                list_item_matches = re.findall(r"<li[^>]*>(.*?)</li>", section_content, re.DOTALL)
+                list_item_matches = _HTML_LIST_ITEM_PATTERN.findall(html_content, start_pos, end_pos)
 
                 for item_html in list_item_matches:
                     req_text = self._clean_html_text(item_html)
@@ -193,43 +323,30 @@ class EARSValidator:
     def _clean_html_text(self, html_text: str) -> str:
         """Clean HTML text and entities."""
         # Remove HTML tags and clean up the text
-        text = re.sub(r"<[^>]+>", "", html_text)
-        text = re.sub(r"\s+", " ", text.strip())
+        text = _HTML_TAG_PATTERN.sub("", html_text)
+        text = _WHITESPACE_PATTERN.sub(" ", text.strip())
 
         # Use markdown parsing knowledge to clean up entities
         text = text.replace("&lt;", "<").replace("&gt;", ">").replace("&amp;", "&")
 
         # Strip REQ-ID prefixes for EARS validation
-        # First try strict pattern for valid REQ-IDs
-        req_id_pattern = r"^(REQ-\d+|TR-\d+|NFR-\d+|KPI-\d+):\s*(.+)$"
-        req_id_match = re.match(req_id_pattern, text)
-        if req_id_match:
-            text = req_id_match.group(2).strip()
-        else:
-            # Also handle malformed REQ-ID patterns that should be stripped
-            # This catches cases like REQ-ABC, REQ-, REQ:, REQ-01-02, etc.
-            loose_pattern = r"^(REQ[-A-Za-z0-9]*|TR[-A-Za-z0-9]*|NFR[-A-Za-z0-9]*|KPI[-A-Za-z0-9]*):\s*(.+)$"
-            loose_match = re.match(loose_pattern, text)
-            if loose_match:
-                # Extract content after the malformed REQ-ID
-                text = loose_match.group(2).strip()
-
-        return text
+        return _strip_req_id_prefix(text)
 
-    def _extract_from_text(self, markdown_text: str, functional_headers: list[str]) -> list[str]:
+    def _extract_from_text(self, markdown_text: str, functional_headers: tuple[str, ...]) -> list[str]:
         """Fallback extraction using line-by-line parsing."""
         requirements = []
-        lines = markdown_text.split("\n")
         in_functional_section = False
         current_header_level = 0
 
-        for line in lines:
+        # Split on "\n" only; the strip() below also drops the "\r" of CRLF endings
+        for line in markdown_text.split("\n"):
             stripped_line = line.strip()
 
             # Check for headers
             if stripped_line.startswith("#"):
-                header_level = len(stripped_line) - len(stripped_line.lstrip("#"))
-                header_text = stripped_line.lstrip("# ").strip()
+                header_body = stripped_line.lstrip("#")
+                header_level = len(stripped_line) - len(header_body)
+                header_text = header_body.lstrip("# ").strip()
 
                 # Check if we're entering functional requirements section
                 if header_text in functional_headers:
@@ -251,60 +368,42 @@ class EARSValidator:
 
     def _extract_list_item(self, line: str) -> str:
         """Extract requirement text from a markdown list item."""
-        # Handle various markdown list formats
-        list_patterns = [
-            r"^[-*+]\s+(.+)$",  # Standard markdown lists
-            r"^\d+\.\s+(.+)$",  # Numbered lists
-            r"^•\s+(.+)$",  # Bullet points
-            r"^\s*[-*+]\s+(.+)$",  # Indented lists
-            r"^\s*\d+\.\s+(.+)$",  # Indented numbered lists
-        ]
-
-        for pattern in list_patterns:
-            match = re.match(pattern, line)
-            if match:
-                req_text = match.group(1).strip()
-                # Clean up markdown syntax using markdown knowledge
-                req_text = re.sub(r"\*\*(.+?)\*\*", r"\1", req_text)  # Bold
-                req_text = re.sub(r"\*(.+?)\*", r"\1", req_text)  # Italic
-                req_text = re.sub(r"`(.+?)`", r"\1", req_text)  # Code
-                req_text = re.sub(r"\[(.+?)\]\(.+?\)", r"\1", req_text)  # Links
-
-                # Strip REQ-ID prefixes for EARS validation
-                # First try strict pattern for valid REQ-IDs
-                req_id_pattern = r"^(REQ-\d+|TR-\d+|NFR-\d+|KPI-\d+):\s*(.+)$"
-                req_id_match = re.match(req_id_pattern, req_text)
-                if req_id_match:
-                    req_text = req_id_match.group(2).strip()
-                else:
-                    # Also handle malformed REQ-ID patterns that should be stripped
-                    # This catches cases like REQ-ABC, REQ-, REQ:, REQ-01-02, etc.
-                    loose_pattern = r"^(REQ[-A-Za-z0-9]*|TR[-A-Za-z0-9]*|NFR[-A-Za-z0-9]*|KPI[-A-Za-z0-9]*):\s*(.+)$"
-                    loose_match = re.match(loose_pattern, req_text)
-                    if loose_match:
-                        # Extract content after the malformed REQ-ID
-                        req_text = loose_match.group(2).strip()
-
-                return req_text
-
-        return ""
+        # Pick the list format from the first character so prose lines never reach a regex
+        item = line.lstrip()
+        if not item:
+            return ""
+        marker = item[0]
+        if marker in "-*+":
+            pattern = _BULLET_LIST_ITEM_PATTERN
+        elif marker.isdecimal():
+            pattern = _NUMBERED_LIST_ITEM_PATTERN
+        elif marker == "•" and len(item) == len(line):
+            pattern = _BULLET_POINT_ITEM_PATTERN
+        else:
+            return ""
+
+        match = pattern.match(item)
+        if not match:
+            return ""
+
+        # Clean up markdown syntax using markdown knowledge
+        req_text = _strip_inline_markdown(match.group(1).strip())
+
+        # Strip REQ-ID prefixes for EARS validation
+        return _strip_req_id_prefix(req_text)
 
     def _is_requirement_item(self, text: str) -> bool:
         """Check if the text is a functional requirement (not acceptance criteria or other content)."""
         # Skip acceptance criteria and other non-requirement items
-        skip_patterns = [
-            r"受け入れ観点",  # Acceptance criteria
-            r"受入観点",  # Acceptance criteria (alternative)
-            r"Acceptance criteria",
-            r"テスト観点",  # Test criteria
-            r"Test criteria",
-            r"注意事項",  # Notes
-            r"Note:",
-            r"備考",  # Remarks
-            r"Remark:",
-        ]
+        return _NON_REQUIREMENT_PATTERN.search(text) is None
+
 
-        return all(not re.search(pattern, text, re.IGNORECASE) for pattern in skip_patterns)
+@functools.lru_cache(maxsize=_EARS_CACHE_SIZE)
+def _validate_ears_cached(content: str, language: Language) -> EARSValidationResult:
+    """Validate EARS patterns once per distinct document."""
+    validator = EARSValidator(language)
+    requirements = validator.extract_requirements_from_markdown(content)
+    return validator.validate_ubiquitous(requirements)
 
 
 def validate_ears_in_content(content: str, language: Language = Language.JAPANESE) -> EARSValidationResult:
@@ -319,6 +418,4 @@ def validate_ears_in_content(content: str, language: Language = Language.JAPANES
     Returns:
         EARS validation result
     """
-    validator = EARSValidator(language)
-    requirements = validator.extract_requirements_from_markdown(content)
-    return validator.validate_ubiquitous(requirements)
+    return _validate_ears_cached(content, language).model_copy(deep=True)
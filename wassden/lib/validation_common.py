@@ -1,5 +1,7 @@
 """Common validation logic for traceability checking."""
 
+import functools
+import heapq
 import re
 
 # Display limits for error messages
@@ -7,39 +9,75 @@ MAX_DISPLAY_REQUIREMENTS = 5
 MAX_DISPLAY_COMPONENTS = 3
 DEPENDENCY_PARTS_COUNT = 2
 
+_REQ_ID_PATTERN = re.compile(r"\bREQ-\d{2}\b")
+_TR_ID_PATTERN = re.compile(r"\bTR-\d{2}\b")
+_NFR_ID_PATTERN = re.compile(r"\bNFR-\d{2}\b")
+_KPI_ID_PATTERN = re.compile(r"\bKPI-\d{2}\b")
+_TASK_ID_PATTERN = re.compile(r"\bTASK-\d{2}(?:-\d{2}){0,2}\b")
+_TEST_SECTION_PATTERN = re.compile(r"## \d*\.?\s*(テスト戦略|Test Strategy).*?(?=## |$)", re.DOTALL)
+_TEST_SCENARIO_PATTERN = re.compile(r"\*\*([a-zA-Z0-9_-]*test[a-zA-Z0-9_-]*)\*\*:")
+_COMPONENT_DEFINITION_PATTERN = re.compile(r"\*\*([a-zA-Z0-9_-]+)\*\*:")
+_COMPONENT_HEADER_PATTERN = re.compile(r"###\s+([a-zA-Z0-9_-]+)")
+_DEPENDENCY_LINE_PATTERN = re.compile(r"^[^\n]*(?:依存|Depends on)[^\n]*", re.MULTILINE)
+
+# Each numeric ID segment is two digits; task IDs carry two or three segments
+_ID_SEGMENT_WIDTH = 2
+_TASK_ID_SEGMENT_COUNTS = (2, 3)
+
+# Format rules check every requirement/task block, and specs reuse a small set of IDs
+_ID_VALIDATION_CACHE_SIZE = 1024
+
+
+def _is_id_segment(segment: str) -> bool:
+    """Check that an ID segment is a two-digit number other than 00."""
+    return len(segment) == _ID_SEGMENT_WIDTH and segment.isdecimal() and segment != "00"
+
+
+@functools.lru_cache(maxsize=_ID_VALIDATION_CACHE_SIZE)
+def validate_req_id(req_id: str) -> bool:
+    """Validate requirement ID format (REQ-XX where XX is 01-99)."""
+    prefix, _, number = req_id.partition("-")
+    return prefix == "REQ" and _is_id_segment(number)
+
+
+@functools.lru_cache(maxsize=_ID_VALIDATION_CACHE_SIZE)
+def validate_task_id(task_id: str) -> bool:
+    """Validate task ID format (TASK-XX-XX or TASK-XX-XX-XX where XX is 01-99)."""
+    prefix, *segments = task_id.split("-")
+    return prefix == "TASK" and len(segments) in _TASK_ID_SEGMENT_COUNTS and all(map(_is_id_segment, segments))
+
+
+def _find_ids(content: str, prefix: str, pattern: re.Pattern[str]) -> set[str]:
+    """Find IDs with pattern, starting the regex scan at the first prefix occurrence."""
+    start = content.find(prefix) if content else -1
+    if start == -1:
+        return set()
+    return set(pattern.findall(content, start))
+
 
 def extract_req_ids(content: str) -> set[str]:
     """Extract REQ-IDs from content using consistent regex."""
-    if not content:
-        return set()
-    return set(re.findall(r"\bREQ-\d{2}\b", content))
+    return _find_ids(content, "REQ-", _REQ_ID_PATTERN)
 
 
 def extract_tr_ids(content: str) -> set[str]:
     """Extract TR-IDs from content."""
-    tr_ids = re.findall(r"\bTR-\d{2}\b", content)
-    return set(tr_ids)
+    return _find_ids(content, "TR-", _TR_ID_PATTERN)
 
 
 def extract_nfr_ids(content: str) -> set[str]:
     """Extract NFR-IDs from content using consistent regex."""
-    if not content:
-        return set()
-    return set(re.findall(r"\bNFR-\d{2}\b", content))
+    return _find_ids(content, "NFR-", _NFR_ID_PATTERN)
 
 
 def extract_kpi_ids(content: str) -> set[str]:
     """Extract KPI-IDs from content using consistent regex."""
-    if not content:
-        return set()
-    return set(re.findall(r"\bKPI-\d{2}\b", content))
+    return _find_ids(content, "KPI-", _KPI_ID_PATTERN)
 
 
 def extract_task_ids(content: str) -> set[str]:
     """Extract TASK-IDs from content using consistent regex."""
-    if not content:
-        return set()
-    return set(re.findall(r"\bTASK-\d{2}(?:-\d{2}){0,2}\b", content))
+    return _find_ids(content, "TASK-", _TASK_ID_PATTERN)
 
 
 def extract_design_components(content: str) -> set[str]:
@@ -50,11 +88,11 @@ def extract_design_components(content: str) -> set[str]:
     components = set()
 
     # Look for component definitions in the form: **component-name**:
-    component_matches = re.findall(r"\*\*([a-zA-Z0-9_-]+)\*\*:", content)
+    component_matches = _COMPONENT_DEFINITION_PATTERN.findall(content)
     components.update(component_matches)
 
     # Also look for section headers that might be components
-    section_matches = re.findall(r"###\s+([a-zA-Z0-9_-]+)", content)
+    section_matches = _COMPONENT_HEADER_PATTERN.findall(content)
     components.update(section_matches)
 
     return components
@@ -69,11 +107,10 @@ def extract_test_scenarios(content: str) -> set[str]:
 
     # Look for test scenarios in the form: **test-scenario**:
     # Find the test strategy section (Section 6) - support both Japanese and English
-    test_section_match = re.search(r"## \d*\.?\s*(テスト戦略|Test Strategy).*?(?=## |$)", content, re.DOTALL)
+    test_section_match = _TEST_SECTION_PATTERN.search(content)
     if test_section_match:
-        test_section = test_section_match.group(0)
-        # Extract test scenarios from the test section
-        scenario_matches = re.findall(r"\*\*([a-zA-Z0-9_-]*test[a-zA-Z0-9_-]*)\*\*:", test_section)
+        # Extract test scenarios from the test section, scanning it in place
+        scenario_matches = _TEST_SCENARIO_PATTERN.findall(content, *test_section_match.span())
         scenarios.update(scenario_matches)
 
     return scenarios
@@ -82,7 +119,7 @@ def extract_test_scenarios(content: str) -> set[str]:
 def check_requirement_coverage(all_requirements: set[str], referenced_requirements: set[str]) -> list[str]:
     """Check requirement coverage and return validation errors."""
     errors = []
-    missing_refs = list(all_requirements - referenced_requirements)
+    missing_refs = all_requirements - referenced_requirements
 
     if missing_refs:
         errors.append(f"Missing references to requirements: {', '.join(sorted(missing_refs))}")
@@ -93,7 +130,7 @@ def check_requirement_coverage(all_requirements: set[str], referenced_requiremen
 def check_tr_coverage(all_trs: set[str], referenced_trs: set[str]) -> list[str]:
     """Check test requirement coverage and return validation errors."""
     errors = []
-    missing_refs = list(all_trs - referenced_trs)
+    missing_refs = all_trs - referenced_trs
 
     if missing_refs:
         errors.append(f"Missing references to test requirements: {', '.join(sorted(missing_refs))}")
@@ -110,9 +147,10 @@ def check_requirement_coverage_with_threshold(
 
     # 100% coverage required - any missing reference is an error
     if missing_refs:
-        display_refs = missing_refs[:MAX_DISPLAY_REQUIREMENTS]
+        # Show the lowest names so the message does not depend on set iteration order
+        display_refs = heapq.nsmallest(MAX_DISPLAY_REQUIREMENTS, missing_refs)
         suffix = "..." if len(missing_refs) > MAX_DISPLAY_REQUIREMENTS else ""
-        errors.append(f"Requirements not referenced in {context}: {', '.join(sorted(display_refs))}{suffix}")
+        errors.append(f"Requirements not referenced in {context}: {', '.join(display_refs)}{suffix}")
 
     return errors, missing_refs
 
@@ -126,45 +164,45 @@ def check_design_coverage_with_threshold(
 
     # 100% coverage required - any missing reference is an error
     if missing_refs:
-        display_refs = missing_refs[:MAX_DISPLAY_COMPONENTS]
+        # Show the lowest names so the message does not depend on set iteration order
+        display_refs = heapq.nsmallest(MAX_DISPLAY_COMPONENTS, missing_refs)
         suffix = "..." if len(missing_refs) > MAX_DISPLAY_COMPONENTS else ""
-        errors.append(f"Design components not referenced in {context}: {', '.join(sorted(display_refs))}{suffix}")
+        errors.append(f"Design components not referenced in {context}: {', '.join(display_refs)}{suffix}")
 
     return errors, missing_refs
 
 
 def find_component_references(components: set[str], content: str) -> set[str]:
     """Find which components are referenced in content."""
-    referenced = set()
-    for component in components:
-        if component in content:
-            referenced.add(component)
-    return referenced
+    # str.__contains__ stops at the first occurrence, which beats one multi-pattern scan
+    return {component for component in components if component in content}
 
 
 def extract_task_dependencies(content: str) -> dict[str, list[str]]:
     """Extract task dependencies from content using consistent logic."""
     dependencies = {}
-    for line in content.split("\n"):
-        if "依存" in line or "Depends on" in line:
-            parts = line.split(":")
-            if len(parts) == DEPENDENCY_PARTS_COUNT:
-                task_match = re.search(r"\bTASK-\d{2}(?:-\d{2}){0,2}\b", parts[0])
-                if task_match:
-                    task_id = task_match.group(0)
-                    dep_ids = re.findall(r"\bTASK-\d{2}(?:-\d{2}){0,2}\b", parts[1])
-                    dependencies[task_id] = dep_ids
+    # Only lines mentioning a dependency are visited; "TASK-XX 依存: TASK-YY, ..." has exactly one colon
+    for line in _DEPENDENCY_LINE_PATTERN.findall(content):
+        if line.count(":") != DEPENDENCY_PARTS_COUNT - 1:
+            continue
+        task_part, _, dependency_part = line.partition(":")
+        task_match = _TASK_ID_PATTERN.search(task_part)
+        if task_match:
+            dependencies[task_match.group(0)] = _TASK_ID_PATTERN.findall(dependency_part)
     return dependencies
 
 
 def check_circular_dependencies(dependencies: dict[str, list[str]]) -> list[str]:
-    """Check for circular dependencies and return errors."""
+    """Check for circular dependencies and return errors, one per mutually dependent pair."""
     errors = []
+    reported: set[frozenset[str]] = set()
     for task_id, deps in dependencies.items():
-        circular_deps = [
-            f"Circular dependency detected: {task_id} <-> {dep}"
-            for dep in deps
-            if dep in dependencies and task_id in dependencies[dep]
-        ]
-        errors.extend(circular_deps)
+        # dict.fromkeys drops repeated dependencies while keeping their order
+        for dep in dict.fromkeys(deps):
+            if dep not in dependencies or task_id not in dependencies[dep]:
+                continue
+            pair = frozenset((task_id, dep))
+            if pair not in reported:
+                reported.add(pair)
+                errors.append(f"Circular dependency detected: {task_id} <-> {dep}")
     return errors